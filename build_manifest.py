@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Build-Manifest der Doku-Generierung
+Hält pro Repository die konvertierten Versionen, Seitenzahlen, Sidebars und den Status fest,
+damit docusaurus.config.ts die Versionsverzeichnisse nicht selbst scannen muss
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+SCHEMA_VERSION = 1
+
+
+def load_manifest(manifest_file: Path) -> Dict[str, Any]:
+    if manifest_file.exists():
+        try:
+            manifest = json.loads(manifest_file.read_text(encoding='utf-8'))
+            if manifest.get('schemaVersion') == SCHEMA_VERSION:
+                return manifest
+        except ValueError as e:
+            print(f"⚠️  Warning: Ignoring unreadable {manifest_file}: {e}")
+
+    return {'schemaVersion': SCHEMA_VERSION, 'repositories': {}}
+
+
+def save_manifest(manifest_file: Path, manifest: Dict[str, Any]):
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+
+def count_pages(docs_dir: Path) -> int:
+    """Seitenzahl aus dem manifest.json des Konverters, sonst aus dem Verzeichnis"""
+    page_manifest = docs_dir / 'manifest.json'
+    if page_manifest.exists():
+        try:
+            pages = json.loads(page_manifest.read_text(encoding='utf-8')).get('pages', [])
+            return sum(1 for page in pages if page.get('id'))
+        except ValueError:
+            pass
+
+    if not docs_dir.is_dir():
+        return 0
+    return sum(1 for f in docs_dir.iterdir() if f.is_file() and f.suffix in ('.md', '.mdx'))
+
+
+def record(manifest: Dict[str, Any], repo_id: str, version: str, success: bool,
+           docs_dir: Optional[Path], sidebar: Optional[Path], archived: bool = False):
+    repo = manifest['repositories'].setdefault(repo_id, {'current': None, 'versions': []})
+
+    pages = count_pages(docs_dir) if success and docs_dir else 0
+    entry: Dict[str, Any] = {
+        'version': version,
+        'status': 'success' if success and pages > 0 else 'failed',
+        'path': docs_dir.as_posix() if docs_dir else None,
+        'pages': pages,
+        'sidebar': sidebar.as_posix() if success and sidebar and sidebar.exists() else None,
+        'archived': archived,
+    }
+
+    if version == 'current':
+        repo['current'] = entry
+    else:
+        repo['versions'] = [v for v in repo['versions'] if v['version'] != version]
+        repo['versions'].append(entry)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Maintain build-manifest.json for docusaurus.config.ts')
+    parser.add_argument('--manifest', default='build-manifest.json', help='Build manifest file')
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('reset', help='Start a new build manifest')
+
+    record_parser = subparsers.add_parser('record', help='Record the result of one repo version')
+    record_parser.add_argument('--repo', required=True, help='Repository id')
+    record_parser.add_argument('--version', required=True, help="'current' or release version")
+    record_parser.add_argument('--status', choices=['success', 'failed'], required=True, help='Conversion result')
+    record_parser.add_argument('--docs-dir', help='Generated docs directory')
+    record_parser.add_argument('--sidebar', help='Generated sidebar file')
+    record_parser.add_argument('--archived', action='store_true', help='Version was rendered in archive mode')
+
+    args = parser.parse_args()
+
+    manifest_file = Path(args.manifest)
+
+    if args.command == 'reset':
+        save_manifest(manifest_file, {'schemaVersion': SCHEMA_VERSION, 'repositories': {}})
+        return 0
+
+    manifest = load_manifest(manifest_file)
+    record(
+        manifest,
+        args.repo,
+        args.version,
+        args.status == 'success',
+        Path(args.docs_dir) if args.docs_dir else None,
+        Path(args.sidebar) if args.sidebar else None,
+        archived=args.archived,
+    )
+    save_manifest(manifest_file, manifest)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -42,6 +42,30 @@ interface ConfigData {
   };
 }
 
+interface BuildManifestEntry {
+  version: string;
+  status: 'success' | 'failed';
+  path: string | null;
+  pages: number;
+  sidebar: string | null;
+  archived: boolean;
+}
+
+interface BuildManifest {
+  schemaVersion: number;
+  repositories: Record<string, {
+    current: BuildManifestEntry | null;
+    versions: BuildManifestEntry[];
+  }>;
+}
+
+interface RepoDocsState {
+  hasCurrentDocs: boolean;
+  versions: string[];
+  validVersions: string[];
+  sidebarPath?: string;
+}
+
 // 🔥 Load configuration
 function loadRepositoriesConfig(): ConfigData {
   const configPath = path.join(__dirname, 'docusaurus-config.json');
@@ -80,43 +104,56 @@ function loadRepositoriesConfig(): ConfigData {
   }
 }
 
-function docsDirectoryExists(repoId: string): boolean {
-  const docsPath = path.join(__dirname, repoId);
-  
-  if (!fs.existsSync(docsPath)) {
-    return false;
-  }
-  
-  const files = fs.readdirSync(docsPath);
-  const hasMarkdownFiles = files.some(file => 
-    file.endsWith('.md') || file.endsWith('.mdx')
-  );
-  
-  const hasVersionedDocs = fs.existsSync(path.join(__dirname, `${repoId}_versioned_docs`));
-  
-  return hasMarkdownFiles || hasVersionedDocs;
-}
+// 🔥 Build manifest written by generate-docs.sh (one read instead of scanning version dirs)
+function loadBuildManifest(): BuildManifest | null {
+  const manifestPath = path.join(__dirname, 'build-manifest.json');
 
-function loadVersionsForRepo(repoId: string): string[] {
-  const versionsPath = path.join(__dirname, `${repoId}_versions.json`);
-  
   try {
-    if (fs.existsSync(versionsPath)) {
-      const versionsContent = fs.readFileSync(versionsPath, 'utf-8');
-      const versions = JSON.parse(versionsContent);
-      
-      console.log(`   📋 Versions for ${repoId}: ${versions.join(', ')}`);
-      
-      return versions;
+    const manifest: BuildManifest = JSON.parse(fs.readFileSync(manifestPath, 'utf-8'));
+    if (manifest.schemaVersion !== 1) {
+      console.warn(`⚠️  Unsupported build-manifest.json schema ${manifest.schemaVersion}, scanning directories`);
+      return null;
     }
-  } catch (error) {
-    console.warn(`⚠️  Error loading ${repoId}_versions.json:`, error);
+    console.log(`📦 Loaded build-manifest.json (${Object.keys(manifest.repositories).length} repositories)`);
+    return manifest;
+  } catch {
+    return null;
   }
+}
 
-  return [];
+const buildManifest = loadBuildManifest();
+const docsStateCache = new Map<string, RepoDocsState>();
+
+function getRepoDocsState(repoId: string): RepoDocsState {
+  const cached = docsStateCache.get(repoId);
+  if (cached) {
+    return cached;
+  }
+
+  // Repos missing from the manifest (e.g. not built in this run) fall back to a directory scan
+  const entry = buildManifest?.repositories[repoId];
+  let state: RepoDocsState;
+
+  if (entry) {
+    const current = entry.current;
+    state = {
+      hasCurrentDocs: current?.status === 'success' && current.pages > 0,
+      versions: entry.versions.map(v => v.version),
+      validVersions: entry.versions
+        .filter(v => v.status === 'success' && v.pages > 0)
+        .map(v => v.version),
+      sidebarPath: current?.status === 'success' && current.sidebar ? `./${current.sidebar}` : undefined,
+    };
+  } else {
+    state = scanRepoDocsState(repoId);
+  }
+
+  docsStateCache.set(repoId, state);
+  return state;
 }
 
-function generateVersionConfig(repoId: string, settings: ConfigData['settings']) {
+// Fallback without build-manifest.json: inspect the generated directories
+function scanRepoDocsState(repoId: string): RepoDocsState {
   const versions = loadVersionsForRepo(repoId);
   const docsPath = path.join(__dirname, repoId);
 
@@ -152,10 +189,44 @@ function generateVersionConfig(repoId: string, settings: ConfigData['settings'])
       return exists;
     });
   }
+
+  const sidebarPath = fs.existsSync(path.join(docsPath, 'sidebars.json'))
+    ? `./${repoId}/sidebars.json`
+    : undefined;
+
+  return {hasCurrentDocs, versions, validVersions, sidebarPath};
+}
+
+function docsDirectoryExists(repoId: string): boolean {
+  const state = getRepoDocsState(repoId);
+  return state.hasCurrentDocs || state.validVersions.length > 0;
+}
+
+function loadVersionsForRepo(repoId: string): string[] {
+  const versionsPath = path.join(__dirname, `${repoId}_versions.json`);
+  
+  try {
+    if (fs.existsSync(versionsPath)) {
+      const versionsContent = fs.readFileSync(versionsPath, 'utf-8');
+      const versions = JSON.parse(versionsContent);
+      
+      console.log(`   📋 Versions for ${repoId}: ${versions.join(', ')}`);
+      
+      return versions;
+    }
+  } catch (error) {
+    console.warn(`⚠️  Error loading ${repoId}_versions.json:`, error);
+  }
+
+  return [];
+}
+
+function generateVersionConfig(repoId: string, settings: ConfigData['settings']) {
+  const {hasCurrentDocs, versions, validVersions} = getRepoDocsState(repoId);
   
   console.log(`   📋 Debug ${repoId}:`);
-  console.log(`      - ${repoId}_versions.json: ${versions.length > 0 ? versions.join(', ') : 'none'}`);
-  console.log(`      - ${repoId}_versioned_docs/ exists: ${hasVersionedDocs}`);
+  console.log(`      - source: ${buildManifest?.repositories[repoId] ? 'build-manifest.json' : 'directory scan'}`);
+  console.log(`      - versions: ${versions.length > 0 ? versions.join(', ') : 'none'}`);
   console.log(`      - valid ${repoId}_versioned_docs/: ${validVersions.length > 0 ? validVersions.join(', ') : 'none'}`);
   console.log(`      - current docs (${repoId}/*.md): ${hasCurrentDocs}`);
 
@@ -258,9 +329,7 @@ const docsPlugins = repositories
     
     const basePath = repo.id;
     
-    const sidebarPath = fs.existsSync(path.join(__dirname, basePath, 'sidebars.json'))
-      ? `./${basePath}/sidebars.json`
-      : undefined;
+    const {sidebarPath} = getRepoDocsState(repo.id);
     
     return [
       '@docusaurus/plugin-content-docs',
@@ -397,25 +466,7 @@ const config: Config = {
           .filter((item): item is NonNullable<typeof item> => item !== null),
         ...repositories
           .map(repo => {
-            const versions = loadVersionsForRepo(repo.id);
-            const docsPath = path.join(__dirname, repo.id);
-            
-            let hasCurrentDocs = false;
-            if (fs.existsSync(docsPath)) {
-              const files = fs.readdirSync(docsPath);
-              hasCurrentDocs = files.some(file => 
-                file.endsWith('.md') || file.endsWith('.mdx')
-              );
-            }
-            
-            const versionedDocsPath = path.join(__dirname, `${repo.id}_versioned_docs`);
-            let validVersions: string[] = [];
-            if (fs.existsSync(versionedDocsPath) && versions.length > 0) {
-              validVersions = versions.filter(version => {
-                const versionPath = path.join(versionedDocsPath, `version-${version}`);
-                return fs.existsSync(versionPath);
-              });
-            }
+            const {hasCurrentDocs, validVersions} = getRepoDocsState(repo.id);
             
             const totalVersions = hasCurrentDocs ? validVersions.length + 1 : validVersions.length;
             
@@ -478,19 +529,7 @@ const config: Config = {
               href: `https://github.com/${settings.branding.organizationName}`,
             },
             ...repositories
-              .filter(repo => {
-                const versions = loadVersionsForRepo(repo.id);
-                const versionedDocsPath = path.join(__dirname, `${repo.id}_versioned_docs`);
-                
-                if (!fs.existsSync(versionedDocsPath) || versions.length === 0) {
-                  return false;
-                }
-                
-                return versions.some(version => {
-                  const versionPath = path.join(versionedDocsPath, `version-${version}`);
-                  return fs.existsSync(versionPath);
-                });
-              })
+              .filter(repo => getRepoDocsState(repo.id).validVersions.length > 0)
               .map(repo => ({
                 label: `${repo.label} Versions`,
                 to: `/${repo.id}/versions`,
@@ -1,16 +1,186 @@
 #!/usr/bin/env python3
 """
 Doxygen XML → Docusaurus Markdown Converter
-Unterstützt: Sections, Tabellen, Mermaid-Diagramme, @verbatim
+Unterstützt: Sections, Tabellen, Mermaid-Diagramme, @verbatim, Deploy-Manifest,
+virtualisierte Daten-Tabellen und lazy Mermaid-Diagramme (MDX),
+JSON-Zwischenformat (--format json, siehe build_ir)
 """
 
 import argparse
+import gzip
+import hashlib
 import json
+import os
 import re
 import xml.etree.ElementTree as ET
-from html import unescape
+import zlib
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+# <codeline> Whitespace-Elemente und Sonder-Leerzeichen in Programmlistings
+CODE_WHITESPACE_TAGS = {'sp': ' ', 'tab': '\t', 'linebreak': '\n'}
+CODE_SPACE_TRANSLATION = str.maketrans({'\xa0': ' ', '\u2009': ' ', '\u202f': ' '})
+
+# Deploy-Manifest im Ausgabeverzeichnis
+MANIFEST_FILE = 'manifest.json'
+
+# Verzeichnis (relativ zur Seite) für ausgelagerte JSON-Daten
+DATA_DIR = '_data'
+
+# MDX-Komponenten, die Seiten referenzieren können → Import-Zeile
+MDX_COMPONENTS = {
+    'VirtualTable': "import VirtualTable from '@site/src/components/VirtualTable';",
+    'LazyMermaid': "import LazyMermaid from '@site/src/components/LazyMermaid';",
+}
+
+# Ab dieser Zeilenzahl gilt ein Mermaid-Diagramm als groß (→ immer lazy)
+LAZY_MERMAID_LARGE_LINES = 40
+
+# JSON-Zwischenformat (IR); Major-Version erhöhen bei inkompatiblen Änderungen
+IR_FORMAT = 'wb-docs/doxygen-ir'
+IR_SCHEMA_VERSION = 2
+IR_FILE = 'doxygen-ir.json'
+
+
+def content_hash(data: bytes) -> str:
+    return 'sha256:' + hashlib.sha256(data).hexdigest()
+
+
+def manifest_diff(baseline: Dict[str, str], baseline_global: List[str], pages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Diff der Seiten gegen den Stand des vorherigen Manifests.
+
+    'global' ist gesetzt, wenn sich eine seitenübergreifende Datei (Sidebar, versions.md)
+    geändert hat – dann ist die Navigation aller Seiten betroffen.
+    """
+    current = {page['path']: page['hash'] for page in pages}
+    global_paths = {page['path'] for page in pages if page.get('global')} | set(baseline_global)
+
+    added = [path for path in current if path not in baseline]
+    changed = [path for path in current if path in baseline and baseline[path] != current[path]]
+    removed = sorted(path for path in baseline if path not in current)
+
+    return {
+        'added': added,
+        'changed': changed,
+        'removed': removed,
+        'unchanged': sum(1 for path in current if baseline.get(path) == current[path]),
+        'global': any(path in global_paths for path in added + changed + removed),
+    }
+
+
+def finalize_manifest(output_dir: Path, extra_files: List[Path]) -> Dict[str, Any]:
+    """Hasht die Seiten nach der Nachbearbeitung (sed-Pässe, Sidebar, versions.md) neu.
+
+    Der Diff wird gegen die im Manifest gespeicherte Baseline des vorherigen Laufs berechnet,
+    daher kann diese Funktion beliebig oft aufgerufen werden.
+    """
+    manifest_file = output_dir / MANIFEST_FILE
+    manifest = json.loads(manifest_file.read_text(encoding='utf-8'))
+    extra_paths = {os.path.relpath(extra, output_dir).replace(os.sep, '/') for extra in extra_files}
+
+    pages: List[Dict[str, Any]] = []
+    for page in manifest['pages']:
+        if page['path'] in extra_paths:
+            continue
+        page_file = output_dir / page['path']
+        if page_file.exists():
+            page['hash'] = content_hash(page_file.read_bytes())
+            pages.append(page)
+
+    for extra in extra_files:
+        if extra.exists():
+            pages.append({
+                'id': None,
+                'path': os.path.relpath(extra, output_dir).replace(os.sep, '/'),
+                'sources': [],
+                'hash': content_hash(extra.read_bytes()),
+                'version': manifest['version'],
+                'global': True,
+            })
+
+    manifest['pages'] = sorted(pages, key=lambda page: page['path'])
+    manifest['diff'] = manifest_diff(manifest.get('baseline', {}), manifest.get('baselineGlobal', []),
+                                     manifest['pages'])
+    manifest['finalized'] = True
+
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    return manifest
+
+
+def first_paragraph(text: str) -> str:
+    """Erster Textabsatz einer Beschreibung als einzelne Zeile (für Listen im Archiv-Modus)"""
+    text = re.sub(r'```.*?```', '', text, flags=re.DOTALL)
+    for paragraph in re.split(r'\n\s*\n', text):
+        paragraph = paragraph.strip()
+        # Tabellen, Admonitions, Überschriften und HTML/MDX-Blöcke passen nicht in eine Listenzeile
+        if not paragraph or paragraph.startswith(('|', ':::', '#', '<')):
+            continue
+        return ' '.join(paragraph.split())
+    return ''
+
+
+# Inline-Markdown in Tabellenzellen: `code`, [text](href), **bold**, *em*
+INLINE_MARKDOWN = re.compile(r'`([^`]+)`|\[([^\]]+)\]\(([^)\s]+)\)|\*\*(.+?)\*\*|\*([^*\s][^*]*?)\*')
+
+
+def markdown_runs(text: str) -> List[Dict[str, Any]]:
+    """Zerlegt Inline-Markdown einer Zelle in Runs {text, code?, bold?, em?, href?} für <VirtualTable>"""
+    runs: List[Dict[str, Any]] = []
+    pos = 0
+    for match in INLINE_MARKDOWN.finditer(text):
+        if match.start() > pos:
+            runs.append({'text': text[pos:match.start()]})
+        code, link_text, href, bold, em = match.groups()
+        if code is not None:
+            runs.append({'text': code, 'code': True})
+        elif link_text is not None:
+            run: Dict[str, Any] = {'text': link_text.strip('`'), 'href': href}
+            if link_text.startswith('`') and link_text.endswith('`'):
+                run['code'] = True
+            runs.append(run)
+        elif bold is not None:
+            runs.append({'text': bold, 'bold': True})
+        else:
+            runs.append({'text': em, 'em': True})
+        pos = match.end()
+    if pos < len(text):
+        runs.append({'text': text[pos:]})
+    return runs
+
+
+def markdown_table(rows: List[List[str]]) -> str:
+    """Markdown-Tabelle; erste Zeile ist der Header, kürzere Zeilen werden aufgefüllt"""
+    header = rows[0]
+    md_lines = [
+        '| ' + ' | '.join(header) + ' |',
+        '|' + '|'.join(['---' for _ in header]) + '|',
+    ]
+
+    for row in rows[1:]:
+        md_lines.append('| ' + ' | '.join(row + [''] * (len(header) - len(row))) + ' |')
+
+    return '\n'.join(md_lines)
+
+
+def register_data_table(data_files: Dict[str, Dict[str, Any]], columns: List[str], rows: List[List[str]]) -> str:
+    """Lagert eine Tabelle als JSON aus und liefert das <VirtualTable>-Tag dafür.
+
+    Zellen sind Inline-Markdown und werden als Runs gespeichert, damit die Komponente
+    sie ohne Markdown-Parser darstellen kann.
+    """
+    width = max([len(columns)] + [len(row) for row in rows])
+    data = {
+        'columns': columns + [''] * (width - len(columns)),
+        'rows': [[markdown_runs(cell) for cell in row + [''] * (width - len(row))] for row in rows],
+    }
+
+    digest = hashlib.sha1(json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+    key = f"table-{digest[:12]}"
+    data_files[key] = data
+
+    return f"<VirtualTable load={{() => import('./{DATA_DIR}/{key}.json')}} rows={{{len(rows)}}} />"
 
 
 class DoxygenLayoutParser:
@@ -64,20 +234,37 @@ class DoxygenLayoutParser:
 class DoxygenXMLParser:
     """Parst Doxygen XML Dateien"""
 
-    def __init__(self, xml_dir: Path):
+    def __init__(self, xml_dir: Path, link_code_refs: bool = False):
         self.xml_dir = xml_dir
+        self.link_code_refs = link_code_refs
         self.groups: Dict[str, Dict[str, Any]] = {}
-        self.index_content: Optional[Dict[str, str]] = None
+        self.index_content: Optional[Dict[str, Any]] = None
+        self.index_source: Optional[str] = None
+        self.members: Dict[str, Tuple[str, str]] = {}
         self._processed_para_ids: Set[int] = set()
+        self._tables: List[Dict[str, Any]] = []
 
     def parse(self):
         print("📖 Parsing Doxygen XML...")
 
+        trees: List[Tuple[Path, Any]] = []
+        for xml_file in sorted(self.xml_dir.glob("group__*.xml")):
+            try:
+                trees.append((xml_file, ET.parse(xml_file)))
+            except ET.ParseError as e:
+                print(f"   ⚠️  Warning: Could not parse {xml_file.name}: {e}")
+
+        if self.link_code_refs:
+            # refid → (kind, name) aller Gruppen-Member, damit Links in Listings Anker finden
+            for _, tree in trees:
+                for memberdef in tree.iter('memberdef'):
+                    self.members[memberdef.get('id', '')] = (memberdef.get('kind', ''), memberdef.findtext('name', ''))
+
+        # Erst nach dem Member-Index, da auch Listings der Startseite auf Gruppen-Member verweisen
         self._parse_index()
 
-        group_files = list(self.xml_dir.glob("group__*.xml"))
-        for xml_file in group_files:
-            self._parse_group(xml_file)
+        for xml_file, tree in trees:
+            self._parse_group(xml_file, tree)
 
         print(f"   ✅ Parsed {len(self.groups)} groups")
 
@@ -90,6 +277,7 @@ class DoxygenXMLParser:
 
                 if compound is not None:
                     title = compound.findtext('title', 'API Documentation')
+                    self._tables = []
 
                     self._processed_para_ids.clear()
                     brief = self._get_description_all(compound.find('briefdescription'))
@@ -101,12 +289,13 @@ class DoxygenXMLParser:
                         'title': title,
                         'brief': brief,
                         'detailed': detailed,
+                        'tables': self._tables,
                     }
+                    self.index_source = filename
                     return
 
-    def _parse_group(self, xml_file: Path):
+    def _parse_group(self, xml_file: Path, tree):
         try:
-            tree = ET.parse(xml_file)
             compound = tree.find('.//compounddef[@kind="group"]')
 
             if compound is None:
@@ -114,6 +303,7 @@ class DoxygenXMLParser:
 
             name = compound.findtext('compoundname', '')
             title = compound.findtext('title', name)
+            self._tables = []
 
             self._processed_para_ids.clear()
             brief = self._get_description_direct(compound.find('briefdescription'))
@@ -162,6 +352,8 @@ class DoxygenXMLParser:
                 'typedefs': typedefs,
                 'enums': enums,
                 'defines': defines,
+                'tables': self._tables,
+                'source': xml_file.name,
             }
 
         except Exception as e:
@@ -312,7 +504,8 @@ class DoxygenXMLParser:
 
             for child in para:
                 if child.tag == 'programlisting':
-                    code_block = self._programlisting_to_code(child)
+                    refs: Optional[List[Tuple[str, str, str]]] = [] if self.link_code_refs else None
+                    code_block = self._programlisting_to_code(child, refs)
 
                     if self._is_mermaid(code_block):
                         code_block = self._normalize_mermaid(code_block)
@@ -321,6 +514,10 @@ class DoxygenXMLParser:
                         lang = self._detect_programlisting_language(child)
                         result.append(f"\n```{lang}\n{code_block}\n```\n")
 
+                        links = self._code_ref_links(refs or [])
+                        if links:
+                            result.append(f"**References:** {links}")
+
                 if child.tail and child.tail.strip():
                     result.append(child.tail.strip())
 
@@ -394,40 +591,64 @@ class DoxygenXMLParser:
 
         return ' '.join(filter(None, result)).strip()
 
-    def _programlisting_to_code(self, programlisting) -> str:
+    def _programlisting_to_code(self, programlisting, refs: Optional[List[Tuple[str, str, str]]] = None) -> str:
         """Extract code from programlisting - preserve spaces in lines"""
-        lines = []
-        for codeline in programlisting.findall('./codeline'):
-            # Use helper to preserve whitespace nodes like <sp> and <tab>
-            text = self._node_to_text_preserving_whitespace(codeline)
-            lines.append(text)
+        lines = [self._codeline_to_text(codeline, refs) for codeline in programlisting.findall('./codeline')]
         return '\n'.join(lines).strip('\n')
 
-    def _node_to_text_preserving_whitespace(self, element) -> str:
-        """Recursively extract text while preserving <sp> and <tab> tags"""
-        parts = []
-        if element.text:
-            parts.append(element.text)
-        
-        for child in element:
-            if child.tag == 'sp':
-                parts.append(' ')
-            elif child.tag == 'tab':
-                parts.append('\t')
-            elif child.tag == 'linebreak':
-                parts.append('\n')
-            else:
-                # Recursive call for other tags (highlight, ref, etc.)
-                parts.append(self._node_to_text_preserving_whitespace(child))
-            
-            if child.tail:
-                parts.append(child.tail)
-        
-        text = "".join(parts)
-        text = unescape(text)
-        # Only replace non-breaking spaces with normal spaces
-        text = text.replace('\xa0', ' ').replace('\u2009', ' ').replace('\u202f', ' ')
-        return text
+    def _codeline_to_text(self, codeline, refs: Optional[List[Tuple[str, str, str]]] = None) -> str:
+        """Single pass over a <codeline> keeping <sp>, <tab> and <linebreak>.
+
+        ElementTree has already resolved XML entities, so the text is not unescaped again.
+        If refs is given, (text, refid, kindref) of every <ref> is appended to it.
+        """
+        parts: List[str] = [codeline.text or '']
+        stack: List[Tuple[Iterator[Any], str]] = [(iter(codeline), '')]
+
+        while stack:
+            children, tail = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                parts.append(tail)
+                continue
+
+            whitespace = CODE_WHITESPACE_TAGS.get(child.tag)
+            if whitespace is not None:
+                parts.append(whitespace)
+                parts.append(child.tail or '')
+                continue
+
+            if child.tag == 'ref' and refs is not None and child.get('refid'):
+                refs.append((''.join(child.itertext()), child.get('refid'), child.get('kindref', 'member')))
+
+            parts.append(child.text or '')
+            stack.append((iter(child), child.tail or ''))
+
+        return ''.join(parts).translate(CODE_SPACE_TRANSLATION)
+
+    def _code_ref_links(self, refs: List[Tuple[str, str, str]]) -> str:
+        """Markdown links for <ref> targets of a program listing (groups and group members only).
+
+        Anchors are only emitted for member kinds whose heading slug is the plain name
+        (function, typedef, enum); macros and enum values link to the group page.
+        """
+        links: List[str] = []
+        for text, refid, kindref in refs:
+            # Member-IDs sind <compound>_1<hash>; Gruppennamen können selbst '_1' enthalten
+            compound = refid if kindref == 'compound' else refid.rpartition('_1')[0]
+            if not compound.startswith('group__') or not text:
+                continue
+            page = compound.replace('group__', '').replace('__', '_')
+            anchor = ''
+            if kindref != 'compound':
+                kind, name = self.members.get(refid, ('', ''))
+                if kind in ('function', 'typedef', 'enum') and name:
+                    anchor = f"#{name.lower()}"
+            link = f"[`{text}`](./{page}{anchor})"
+            if link not in links:
+                links.append(link)
+        return ', '.join(links)
 
     def _detect_programlisting_language(self, programlisting) -> str:
         filename = programlisting.get('filename', '') or ''
@@ -518,18 +739,9 @@ class DoxygenXMLParser:
         if not rows:
             return ""
 
-        header = rows[0]
-        md_lines = [
-            '| ' + ' | '.join(header) + ' |',
-            '|' + '|'.join(['---' for _ in header]) + '|',
-        ]
-
-        for row in rows[1:]:
-            while len(row) < len(header):
-                row.append('')
-            md_lines.append('| ' + ' | '.join(row) + ' |')
-
-        return '\n'.join(md_lines)
+        # Strukturiert mitführen: ob virtualisiert wird, entscheidet erst der Generator
+        self._tables.append({'columns': rows[0], 'rows': rows[1:]})
+        return markdown_table(rows)
 
     def _parse_simplesect(self, simplesect) -> str:
         parts: List[str] = []
@@ -654,13 +866,29 @@ class DoxygenXMLParser:
 class DocusaurusMarkdownGenerator:
     """Generiert Docusaurus Markdown"""
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, version: str = 'current', table_threshold: int = 0,
+                 lazy_mermaid: int = 0):
         self.output_dir = output_dir
-
-    def generate(self, navigation: List[Dict[str, Any]], groups: Dict[str, Dict[str, Any]], index_content: Optional[Dict[str, str]]):
+        self.version = version
+        self.table_threshold = table_threshold
+        self.lazy_mermaid = lazy_mermaid
+        self.index_source: Optional[str] = None
+        self.data_files: Dict[str, Dict[str, Any]] = {}
+        self._pages: List[Dict[str, Any]] = []
+
+    def generate_from_ir(self, ir: Dict[str, Any], archive: bool = False, skip_diagrams: bool = False):
+        """Rendert aus dem JSON-Zwischenformat (siehe build_ir) statt aus Doxygen XML"""
+        self.index_source = ir.get('indexSource')
+
+        if archive:
+            self.generate_archive(ir['navigation'], ir['groups'], ir['index'], skip_diagrams=skip_diagrams)
+        else:
+            self.generate(ir['navigation'], ir['groups'], ir['index'])
+
+    def generate(self, navigation: List[Dict[str, Any]], groups: Dict[str, Dict[str, Any]], index_content: Optional[Dict[str, Any]]):
         print("📝 Generating Docusaurus Markdown...")
 
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._reset_output()
 
         if index_content:
             self._write_index(index_content, navigation, groups)
@@ -669,10 +897,297 @@ class DocusaurusMarkdownGenerator:
             self._write_group(group_name, group_data)
 
         self._write_sidebars(navigation, groups)
+        self._write_manifest()
 
         print(f"   ✅ Generated {len(groups) + 1} Markdown files")
 
-    def _write_index(self, index_content: Dict[str, str], navigation: List[Dict[str, Any]], groups: Dict[str, Dict[str, Any]]):
+    def generate_archive(self, navigation: List[Dict[str, Any]], groups: Dict[str, Dict[str, Any]],
+                         index_content: Optional[Dict[str, Any]], skip_diagrams: bool = False):
+        """Kompakter Archiv-Modus: eine Seite pro Gruppe (gleiche Doc-IDs) mit Signaturen und Briefs"""
+        print("🗄️  Generating archived Docusaurus Markdown...")
+
+        self._reset_output()
+
+        ordered: List[str] = []
+        for nav in navigation:
+            for ref in [nav.get('group_ref')] + [sub.get('group_ref') for sub in nav.get('subtabs', [])]:
+                if ref and ref in groups and ref not in ordered:
+                    ordered.append(ref)
+        ordered.extend(sorted(name for name in groups if name not in ordered))
+
+        self._write_archived_index(index_content, ordered, groups, skip_diagrams)
+
+        for name in ordered:
+            self._write_archived_group(name, groups[name])
+
+        # Flache Sidebar: Übersicht plus alle Gruppen ohne Kategorien
+        sidebar_items: List[Dict[str, Any]] = [{'type': 'doc', 'id': 'index', 'label': 'Overview'}]
+        sidebar_items.extend({'type': 'doc', 'id': name, 'label': groups[name]['title']} for name in ordered)
+
+        self._write_page('sidebars.json', json.dumps({'apiSidebar': sidebar_items}, indent=2, ensure_ascii=False),
+                         None, [], is_global=True)
+        print("   ✅ sidebars.json")
+
+        self._write_manifest()
+
+        print(f"   ✅ Archived {len(groups)} groups")
+
+    def _archive_note(self) -> List[str]:
+        return [
+            ":::note",
+            "",
+            f"Archived version {self.version}: only signatures and brief descriptions are shown.",
+            "",
+            ":::",
+            "",
+        ]
+
+    def _write_archived_index(self, index_content: Optional[Dict[str, Any]], ordered: List[str],
+                              groups: Dict[str, Dict[str, Any]], skip_diagrams: bool):
+        title = index_content['title'] if index_content else 'API Documentation'
+        lines = [
+            "---",
+            "id: index",
+            "slug: /",
+            f"title: {title}",
+            "sidebar_label: Overview",
+            "---",
+            "",
+            f"# {title}",
+            "",
+        ] + self._archive_note()
+
+        if index_content:
+            brief = first_paragraph(index_content['brief'])
+            if brief:
+                lines.extend([brief, ""])
+            if not skip_diagrams:
+                # Aus der Beschreibung der Startseite bleiben nur die Mermaid-Diagramme erhalten
+                for diagram in re.findall(r'```mermaid\n.*?\n```', index_content['detailed'], flags=re.DOTALL):
+                    lines.extend([diagram, ""])
+
+        sources = [self.index_source] if self.index_source else []
+
+        lines.extend(["## Components", ""])
+        for name in ordered:
+            data = groups[name]
+            if data.get('source'):
+                sources.append(data['source'])
+            brief = first_paragraph(data['brief'])
+            lines.append(f"- [{data['title']}](./{name})" + (f" — {brief}" if brief else ""))
+        lines.append("")
+
+        filename = self._write_doc("index", lines, sources)
+        print(f"   ✅ {filename}")
+
+    def _write_archived_group(self, name: str, data: Dict[str, Any]):
+        lines = [
+            "---",
+            f"id: {name}",
+            f"title: {data['title']}",
+            f"sidebar_label: {data['title']}",
+            "---",
+            "",
+            f"# {data['title']}",
+            "",
+        ] + self._archive_note()
+
+        brief = first_paragraph(data['brief'])
+        if brief:
+            lines.extend([brief, ""])
+
+        def entry(code: str, brief: str) -> str:
+            brief = first_paragraph(brief)
+            return f"- `{code}`" + (f" — {brief}" if brief else "")
+
+        entries: List[str] = []
+        for typedef in data['typedefs']:
+            entries.append(entry(typedef['definition'], typedef['brief']))
+        for enum in data['enums']:
+            values = ', '.join(value['name'] for value in enum['values'])
+            entries.append(entry(f"enum {enum['name']} {{ {values} }}", enum['brief']))
+        for define in data['defines']:
+            value_str = f" {define['value']}" if define['value'] else ""
+            entries.append(entry(f"#define {define['name']}{value_str}", define['brief']))
+        for func in data['functions']:
+            entries.append(entry(func['signature'], func['brief']))
+
+        if entries:
+            lines.extend(entries)
+            lines.append("")
+
+        if data['innergroups']:
+            lines.extend(["## Sub-Modules", ""])
+            for ig in data['innergroups']:
+                group_id = ig['refid'].replace('group__', '').replace('__', '_')
+                lines.append(f"- [{ig['name']}](./{group_id})")
+            lines.append("")
+
+        filename = self._write_doc(name, lines, [data['source']] if data.get('source') else [])
+        print(f"   ✅ {filename}")
+
+    def _reset_output(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._pages = []
+
+        data_dir = self.output_dir / DATA_DIR
+        if data_dir.is_dir():
+            for stale in data_dir.glob('*.json'):
+                stale.unlink()
+
+    def _write_doc(self, name: str, lines: List[str], sources: List[str],
+                   tables: Optional[List[Dict[str, Any]]] = None) -> str:
+        """Schreibt eine Doku-Seite als .md, oder als .mdx falls sie MDX-Komponenten nutzt"""
+        content = '\n'.join(lines)
+
+        if self.table_threshold and tables:
+            content = self._virtualize_tables(content, tables)
+
+        if self.lazy_mermaid:
+            content = self._defer_mermaid(content)
+
+        components = [component for component in MDX_COMPONENTS if f"<{component} " in content]
+        extension = '.mdx' if components else '.md'
+
+        if components:
+            content = self._to_mdx(content, components)
+            for key in dict.fromkeys(re.findall(rf"import\('\./{DATA_DIR}/([\w-]+)\.json'\)", content)):
+                if key in self.data_files:
+                    (self.output_dir / DATA_DIR).mkdir(exist_ok=True)
+                    self._write_page(f"{DATA_DIR}/{key}.json",
+                                     json.dumps(self.data_files[key], ensure_ascii=False), None, sources)
+
+        # Keine doppelten Doc-IDs durch .md/.mdx aus früheren Läufen
+        stale = self.output_dir / f"{name}{'.md' if components else '.mdx'}"
+        if stale.exists():
+            stale.unlink()
+
+        filename = f"{name}{extension}"
+        self._write_page(filename, content, name, sources)
+        return filename
+
+    def _virtualize_tables(self, content: str, tables: List[Dict[str, Any]]) -> str:
+        """Ersetzt Markdown-Tabellen mit mehr als table_threshold Zeilen durch <VirtualTable>.
+
+        Ersetzt wird nur die exakte Tabelle: Eine kürzere Tabelle mit gleichem Header und
+        gleichen ersten Zeilen ist ein Präfix der längeren und darf diese nicht treffen.
+        """
+        for table in tables:
+            if len(table['rows']) > self.table_threshold:
+                markdown = markdown_table([table['columns']] + table['rows'])
+                tag = register_data_table(self.data_files, table['columns'], table['rows'])
+                exact = re.compile(rf'(?m)(?<!\|\n)^{re.escape(markdown)}$(?!\n\|)')
+                content = exact.sub(lambda _: tag, content)
+        return content
+
+    def _defer_mermaid(self, content: str) -> str:
+        """Ersetzt Mermaid-Fences durch <LazyMermaid>, wenn die Seite mehr als
+        lazy_mermaid Diagramme oder ein großes Diagramm enthält"""
+        pattern = re.compile(r'^```mermaid\n(.*?)\n```$', re.DOTALL | re.MULTILINE)
+        diagrams = pattern.findall(content)
+
+        if len(diagrams) <= self.lazy_mermaid and all(
+            source.count('\n') + 1 < LAZY_MERMAID_LARGE_LINES for source in diagrams
+        ):
+            return content
+
+        def replace(match) -> str:
+            source = match.group(1)
+            lines = source.count('\n') + 1
+            edges = len(re.findall(r'--|->|==|\.\.', source))
+            data = {'source': source, 'lines': lines, 'edges': edges}
+
+            digest = hashlib.sha1(source.encode('utf-8')).hexdigest()
+            key = f"mermaid-{digest[:12]}"
+            self.data_files[key] = data
+
+            return (f"<LazyMermaid load={{() => import('./{DATA_DIR}/{key}.json')}} "
+                    f"lines={{{lines}}} edges={{{edges}}} />")
+
+        return pattern.sub(replace, content)
+
+    def _to_mdx(self, content: str, components: List[str]) -> str:
+        """Imports nach dem Frontmatter einfügen und Text außerhalb von Code für MDX escapen"""
+        lines = content.split('\n')
+
+        body_start = 0
+        if lines and lines[0] == '---':
+            body_start = lines.index('---', 1) + 1
+
+        body: List[str] = [''] + [MDX_COMPONENTS[component] for component in components]
+        in_fence = False
+        for line in lines[body_start:]:
+            stripped = line.lstrip()
+            if stripped.startswith('```'):
+                in_fence = not in_fence
+                body.append(line)
+            elif in_fence or any(stripped.startswith(f"<{component} ") for component in components):
+                body.append(line)
+            else:
+                segments = re.split(r'(`[^`]*`)', line)
+                body.append(''.join(
+                    segment if segment.startswith('`') else
+                    segment.replace('{', '\\{').replace('}', '\\}').replace('<', '&lt;')
+                    for segment in segments
+                ))
+
+        return '\n'.join(lines[:body_start] + body)
+
+    def _write_page(self, filename: str, content: str, doc_id: Optional[str], sources: List[str],
+                    is_global: bool = False):
+        """Schreibt eine Datei und merkt sie für das Deploy-Manifest vor"""
+        data = content.encode('utf-8')
+        (self.output_dir / filename).write_bytes(data)
+
+        page: Dict[str, Any] = {
+            'id': doc_id,
+            'path': filename,
+            'sources': sorted(set(sources)),
+            'hash': content_hash(data),
+            'version': self.version,
+        }
+        if is_global:
+            page['global'] = True
+        self._pages.append(page)
+
+    def _write_manifest(self):
+        """Schreibt manifest.json inkl. Diff gegen das vorherige Manifest.
+
+        Die Hashes des vorherigen Manifests werden als Baseline gespeichert, damit
+        finalize_manifest() den Diff nach der Nachbearbeitung neu berechnen kann.
+        """
+        manifest_file = self.output_dir / MANIFEST_FILE
+
+        baseline: Dict[str, str] = {}
+        baseline_global: List[str] = []
+        if manifest_file.exists():
+            try:
+                old = json.loads(manifest_file.read_text(encoding='utf-8'))
+                baseline = {page['path']: page['hash'] for page in old.get('pages', [])}
+                baseline_global = sorted(page['path'] for page in old.get('pages', []) if page.get('global'))
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"   ⚠️  Warning: Ignoring unreadable {MANIFEST_FILE}: {e}")
+
+        pages = sorted(self._pages, key=lambda page: page['path'])
+        diff = manifest_diff(baseline, baseline_global, pages)
+
+        manifest = {
+            'version': self.version,
+            'pages': pages,
+            'diff': diff,
+            'baseline': baseline,
+            'baselineGlobal': baseline_global,
+            'finalized': False,
+        }
+
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+        print(f"   ✅ {MANIFEST_FILE} "
+              f"(+{len(diff['added'])} ~{len(diff['changed'])} -{len(diff['removed'])} ={diff['unchanged']}"
+              f"{', global' if diff['global'] else ''})")
+
+    def _write_index(self, index_content: Dict[str, Any], navigation: List[Dict[str, Any]], groups: Dict[str, Dict[str, Any]]):
         lines = [
             "---",
             "id: index",
@@ -691,11 +1206,15 @@ class DocusaurusMarkdownGenerator:
         if index_content['detailed']:
             lines.extend([index_content['detailed'], ""])
 
+        sources = [self.index_source] if self.index_source else []
+
         lines.extend(["## Components", ""])
         for nav in navigation:
             if nav.get('group_ref') and nav['group_ref'] in groups:
                 group = groups[nav['group_ref']]
                 group_ref = nav['group_ref']
+                if group.get('source'):
+                    sources.append(group['source'])
                 lines.extend([
                     f"### [{group['title']}](./{group_ref})",
                     "",
@@ -703,8 +1222,8 @@ class DocusaurusMarkdownGenerator:
                     "",
                 ])
 
-        (self.output_dir / "index.md").write_text('\n'.join(lines), encoding='utf-8')
-        print("   ✅ index.md")
+        filename = self._write_doc("index", lines, sources, index_content.get('tables'))
+        print(f"   ✅ {filename}")
 
     def _write_group(self, name: str, data: Dict[str, Any]):
         lines = [
@@ -757,7 +1276,16 @@ class DocusaurusMarkdownGenerator:
                 if enum['brief']:
                     lines.extend([enum['brief'], ""])
 
-                if enum['values']:
+                if enum['values'] and self.table_threshold and len(enum['values']) > self.table_threshold:
+                    rows = [
+                        [f"`{value['name']}`", value['initializer'] or '', value['brief'].replace('\n', ' ')]
+                        for value in enum['values']
+                    ]
+                    lines.extend([
+                        register_data_table(self.data_files, ['Enumerator', 'Value', 'Description'], rows),
+                        "",
+                    ])
+                elif enum['values']:
                     lines.extend(["| Enumerator | Value | Description |"])
                     lines.append("|------------|-------|-------------|")
                     for value in enum['values']:
@@ -809,9 +1337,9 @@ class DocusaurusMarkdownGenerator:
 
                 lines.extend(["---", ""])
 
-        output_file = self.output_dir / f"{name}.md"
-        output_file.write_text('\n'.join(lines), encoding='utf-8')
-        print(f"   ✅ {name}.md")
+        sources = [data['source']] if data.get('source') else []
+        filename = self._write_doc(name, lines, sources, data.get('tables'))
+        print(f"   ✅ {filename}")
 
     def _write_sidebars(self, navigation: List[Dict[str, Any]], groups: Dict[str, Dict[str, Any]]):
         sidebar_items: List[Dict[str, Any]] = [
@@ -845,34 +1373,132 @@ class DocusaurusMarkdownGenerator:
             'apiSidebar': sidebar_items,
         }
 
-        config_file = self.output_dir / 'sidebars.json'
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(sidebar_config, f, indent=2, ensure_ascii=False)
+        self._write_page('sidebars.json', json.dumps(sidebar_config, indent=2, ensure_ascii=False), None, [],
+                         is_global=True)
 
         print("   ✅ sidebars.json")
 
 
+def build_ir(navigation: List[Dict[str, Any]], xml_parser: DoxygenXMLParser) -> Dict[str, Any]:
+    """Vollständiges geparstes Modell als versioniertes JSON-Zwischenformat.
+
+    Schema (schemaVersion 2):
+        format        'wb-docs/doxygen-ir'
+        schemaVersion 2
+        options       Parser-Optionen, die in die Texte eingeflossen sind ({linkCodeRefs})
+        navigation    [{type, title, group_ref, subtabs: [...]}] aus DoxygenLayout.xml
+        index         {title, brief, detailed, tables} oder null
+        indexSource   XML-Datei der Index-Seite oder null
+        groups        {name: {title, brief, detailed, innergroups, functions, typedefs,
+                       enums, defines, tables, source}} – Texte sind bereits Markdown
+
+    tables ist [{columns, rows}] aller Tabellen der Seite; im Text stehen sie als
+    Markdown-Tabelle. Render-Optionen (--table-threshold, --lazy-mermaid) gehören nicht ins IR.
+    """
+    return {
+        'format': IR_FORMAT,
+        'schemaVersion': IR_SCHEMA_VERSION,
+        'options': {
+            'linkCodeRefs': xml_parser.link_code_refs,
+        },
+        'navigation': navigation,
+        'index': xml_parser.index_content,
+        'indexSource': xml_parser.index_source,
+        'groups': xml_parser.groups,
+    }
+
+
+def write_ir(ir: Dict[str, Any], ir_file: Path):
+    """Schreibt das IR als JSON, gzip-komprimiert bei Endung .gz"""
+    data = json.dumps(ir, indent=2, ensure_ascii=False).encode('utf-8')
+    if ir_file.suffix == '.gz':
+        # mtime=0 → identische Bytes für identischen Inhalt (cache-freundlich)
+        data = gzip.compress(data, mtime=0)
+    ir_file.write_bytes(data)
+
+
+def load_ir(ir_file: Path) -> Dict[str, Any]:
+    """Lädt und prüft ein IR; unlesbare oder fremde Dateien ergeben ValueError"""
+    data = ir_file.read_bytes()
+    if data[:2] == b'\x1f\x8b':
+        try:
+            data = gzip.decompress(data)
+        except (EOFError, OSError, zlib.error) as e:
+            raise ValueError(f"{ir_file} is truncated or not a valid gzip file: {e}") from e
+    ir = json.loads(data.decode('utf-8'))
+
+    if not isinstance(ir, dict) or ir.get('format') != IR_FORMAT:
+        raise ValueError(f"{ir_file} is not a {IR_FORMAT} file")
+    if ir.get('schemaVersion') != IR_SCHEMA_VERSION:
+        raise ValueError(f"{ir_file} has schemaVersion {ir.get('schemaVersion')}, expected {IR_SCHEMA_VERSION}")
+
+    return ir
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description='Convert Doxygen to Docusaurus Markdown')
-    parser.add_argument('--xml-dir', required=True, help='Doxygen XML directory')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--xml-dir', help='Doxygen XML directory')
+    source.add_argument('--ir', help='Render from a doxygen-ir.json[.gz] file instead of XML')
+    source.add_argument('--finalize-manifest', action='store_true',
+                        help='Re-hash the pages of --output after post-processing and update manifest.json')
     parser.add_argument('--layout', help='DoxygenLayout.xml file (optional)')
     parser.add_argument('--output', required=True, help='Output directory')
-    parser.add_argument('--format', default='docusaurus', help='Output format (docusaurus)')
+    parser.add_argument('--format', choices=['docusaurus', 'json'], default='docusaurus',
+                        help='Output format: docusaurus (Markdown) or json (doxygen-ir.json)')
+    parser.add_argument('--gzip', action='store_true', help='Write doxygen-ir.json.gz with --format json')
+    parser.add_argument('--doc-version', default='current', help='Version recorded in manifest.json (default: current)')
+    parser.add_argument('--archive', action='store_true', help='Render compact pages with signatures and briefs only')
+    parser.add_argument('--skip-diagrams', action='store_true', help='Drop the index Mermaid diagrams in --archive mode')
+    parser.add_argument('--table-threshold', type=int, default=0,
+                        help='Emit tables/enums with more rows as JSON + <VirtualTable> (0 = always inline)')
+    parser.add_argument('--lazy-mermaid', type=int, default=0,
+                        help='Defer Mermaid rendering on pages with more diagrams (or a large one) (0 = off)')
+    parser.add_argument('--link-code-refs', action='store_true', help='List <ref> targets of code listings as links')
+    parser.add_argument('--extra', action='append', default=[],
+                        help='Additional global file for --finalize-manifest (sidebar, versions.md), repeatable')
 
     args = parser.parse_args()
 
-    xml_dir = Path(args.xml_dir)
     output_dir = Path(args.output)
 
-    if not xml_dir.exists():
-        print(f"❌ Error: {xml_dir} not found. Run 'doxygen Doxyfile' first!")
-        return 1
-
-    print("\n🚀 Converting Doxygen to Docusaurus Markdown\n")
-    print("   ✅ Mermaid diagram support enabled")
-    print("   ✅ @verbatim blocks with Mermaid auto-detection")
-    print("   ✅ @mermaid tags and graph keyword detection")
-    print("   ✅ Preserves spaces in Mermaid labels\n")
+    if args.finalize_manifest:
+        if not (output_dir / MANIFEST_FILE).exists():
+            print(f"❌ Error: {output_dir / MANIFEST_FILE} not found")
+            return 1
+        manifest = finalize_manifest(output_dir, [Path(extra) for extra in args.extra])
+        diff = manifest['diff']
+        print(f"   ✅ {MANIFEST_FILE} finalized "
+              f"(+{len(diff['added'])} ~{len(diff['changed'])} -{len(diff['removed'])} ={diff['unchanged']}"
+              f"{', global' if diff['global'] else ''})")
+        return 0
+
+    if args.ir:
+        ir_file = Path(args.ir)
+        if not ir_file.exists():
+            print(f"❌ Error: {ir_file} not found. Run with '--format json' first!")
+            return 1
+        try:
+            ir = load_ir(ir_file)
+        except (ValueError, OSError) as e:
+            print(f"❌ Error: {e}")
+            return 1
+        # Parser-Optionen stecken bereits in den Texten des IR und lassen sich nicht nachträglich ändern
+        if args.link_code_refs and not ir['options'].get('linkCodeRefs'):
+            print(f"❌ Error: {ir_file} was built without --link-code-refs; re-run --format json with it")
+            return 1
+        print(f"\n🚀 Rendering Docusaurus Markdown from {ir_file.name}\n")
+    else:
+        xml_dir = Path(args.xml_dir)
+        if not xml_dir.exists():
+            print(f"❌ Error: {xml_dir} not found. Run 'doxygen Doxyfile' first!")
+            return 1
+
+        print("\n🚀 Converting Doxygen to Docusaurus Markdown\n")
+        print("   ✅ Mermaid diagram support enabled")
+        print("   ✅ @verbatim blocks with Mermaid auto-detection")
+        print("   ✅ @mermaid tags and graph keyword detection")
+        print("   ✅ Preserves spaces in Mermaid labels\n")
 
     navigation: List[Dict[str, Any]] = []
     if args.layout:
@@ -882,11 +1508,23 @@ def main() -> int:
             navigation = layout_parser.parse_navigation()
             print(f"✅ Parsed navigation from {layout_file.name}\n")
 
-    xml_parser = DoxygenXMLParser(xml_dir)
-    xml_parser.parse()
+    if not args.ir:
+        xml_parser = DoxygenXMLParser(Path(args.xml_dir), link_code_refs=args.link_code_refs)
+        xml_parser.parse()
+        ir = build_ir(navigation, xml_parser)
+    elif args.layout:
+        ir['navigation'] = navigation
+
+    if args.format == 'json':
+        output_dir.mkdir(parents=True, exist_ok=True)
+        ir_file = output_dir / (IR_FILE + ('.gz' if args.gzip else ''))
+        write_ir(ir, ir_file)
+        print(f"\n✅ Done! Intermediate representation written to {ir_file}")
+        return 0
 
-    generator = DocusaurusMarkdownGenerator(output_dir)
-    generator.generate(navigation, xml_parser.groups, xml_parser.index_content)
+    generator = DocusaurusMarkdownGenerator(output_dir, version=args.doc_version, table_threshold=args.table_threshold,
+                                            lazy_mermaid=args.lazy_mermaid)
+    generator.generate_from_ir(ir, archive=args.archive, skip_diagrams=args.skip_diagrams)
 
     print(f"\n✅ Done! Markdown files generated in {output_dir}/")
     print("\n💡 Mermaid support:")
@@ -899,4 +1537,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
\ No newline at end of file
+    raise SystemExit(main())
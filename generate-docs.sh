@@ -3,6 +3,9 @@
 # Configuration files
 REPOS_CONFIG_FILE="repositories.conf"
 DOCUSAURUS_CONFIG_FILE="docusaurus-config.json"
+BUILD_MANIFEST_FILE="build-manifest.json"
+# Written during the run and moved into place at the end, so an aborted run keeps the last manifest
+BUILD_MANIFEST_TMP="${BUILD_MANIFEST_FILE}.tmp"
 
 # Configuration: Cleanup
 KEEP_REPOS=false
@@ -15,6 +18,19 @@ MAX_VERSIONS=10
 VERSION_TAG_PATTERN="v*"
 INCLUDE_CURRENT=true
 
+# Archive-Configuration: released versions beyond the newest N are rendered
+# as one compact page (signatures + briefs). 0 = disabled
+ARCHIVE_AFTER_VERSIONS=3
+ARCHIVE_SKIP_DIAGRAMS=true
+
+# Tables/enum lists with more rows are emitted as JSON + virtualized
+# <VirtualTable> component (page becomes .mdx). 0 = always inline Markdown
+TABLE_VIRTUALIZE_THRESHOLD=100
+
+# Pages with more Mermaid diagrams (or one large diagram) render them
+# lazily via <LazyMermaid> when scrolled into view. 0 = always inline fences
+LAZY_MERMAID_THRESHOLD=2
+
 # Colors for output
 GREEN='\033[0;32m'
 BLUE='\033[0;34m'
@@ -34,6 +50,7 @@ declare -gA REPOS_ENABLED
 declare -gA REPOS_DESCRIPTIONS
 declare -gA REPOS_CATEGORIES
 declare -gA REPOS_DISPLAY_MODE
+declare -ga REPO_ORDER=()
 
 load_repositories() {
     echo_step "Loading repository configuration from $REPOS_CONFIG_FILE..."
@@ -45,66 +62,25 @@ load_repositories() {
         return 1
     fi
     
+    local plan
+    if ! plan=$(python3 repo_config.py --config "$REPOS_CONFIG_FILE" plan --format tsv); then
+        echo_error "Could not parse $REPOS_CONFIG_FILE"
+        return 1
+    fi
+    
     local count=0
     local enabled_count=0
     
-    while IFS='|' read -r repo_id repo_url label description field5 field6 field7 || [ -n "$repo_id" ]; do
-        [[ "$repo_id" =~ ^#.*$ ]] && continue
-        [[ -z "$repo_id" ]] && continue
-        
-        repo_id=$(echo "$repo_id" | xargs)
-        repo_url=$(echo "$repo_url" | xargs)
-        label=$(echo "$label" | xargs)
-        description=$(echo "$description" | xargs)
-        field5=$(echo "$field5" | xargs)
-        field6=$(echo "$field6" | xargs)
-        field7=$(echo "$field7" | xargs)
-        
-        # Detect format
-        local category display_mode enabled
-        
-        if [ -z "$field7" ] && [ -z "$field6" ]; then
-            # Old format (5 fields): REPO_ID|URL|LABEL|DESC|ENABLED
-            category="drivers"
-            display_mode="toplevel"
-            enabled="$field5"
-        elif [ -z "$field7" ]; then
-            # Medium format (6 fields): REPO_ID|URL|LABEL|DESC|CATEGORY|ENABLED
-            category="$field5"
-            display_mode="category"
-            enabled="$field6"
-        else
-            # New format (7 fields): REPO_ID|URL|LABEL|DESC|CATEGORY|DISPLAY_MODE|ENABLED
-            category="$field5"
-            display_mode="$field6"
-            enabled="$field7"
-        fi
-        
-        if [ -z "$repo_url" ]; then
-            echo_warn "Skipping invalid line: $repo_id (no URL)"
-            continue
-        fi
-        
-        if [[ ! "$repo_url" =~ \.git$ ]]; then
-            clone_url="${repo_url}.git"
-        else
-            clone_url="$repo_url"
-        fi
-        
-        if [ -z "$label" ]; then
-            label=$(echo "$repo_id" | sed 's/wb-idf-//' | sed 's/-/ /g' | sed 's/\b\(.\)/\u\1/g')
-        fi
-        
-        if [ -z "$description" ]; then
-            description="Documentation for $label"
-        fi
+    while IFS=$'\x1f' read -r repo_id clone_url label description category display_mode enabled; do
+        [ -z "$repo_id" ] && continue
         
+        REPO_ORDER+=("$repo_id")
         REPOS["$repo_id"]="$clone_url"
         REPOS_LABELS["$repo_id"]="$label"
-        REPOS_ENABLED["$repo_id"]="${enabled:-true}"
+        REPOS_ENABLED["$repo_id"]="$enabled"
         REPOS_DESCRIPTIONS["$repo_id"]="$description"
         REPOS_CATEGORIES["$repo_id"]="$category"
-        REPOS_DISPLAY_MODE["$repo_id"]="${display_mode:-category}"
+        REPOS_DISPLAY_MODE["$repo_id"]="$display_mode"
         
         count=$((count + 1))
         
@@ -115,14 +91,14 @@ load_repositories() {
             display_icon="📁"
         fi
         
-        if [ "${enabled:-true}" = "true" ]; then
+        if [ "$enabled" = "true" ]; then
             enabled_count=$((enabled_count + 1))
             echo_info "  ✅ $display_icon $label ($repo_id) [$category/$display_mode]"
         else
             echo_warn "  ⏸️  $display_icon $label ($repo_id) [$category/$display_mode] - deactivated"
         fi
         
-    done < "$REPOS_CONFIG_FILE"
+    done <<< "$plan"
     
     if [ $enabled_count -eq 0 ]; then
         echo_error "No active repositories found!"
@@ -140,150 +116,7 @@ generate_docusaurus_config() {
         cp "$DOCUSAURUS_CONFIG_FILE" "${DOCUSAURUS_CONFIG_FILE}.backup"
     fi
     
-    python3 << 'PYTHON_END'
-import json
-import os
-
-repos_data = []
-
-config_file = os.environ.get('REPOS_CONFIG_FILE', 'repositories.conf')
-
-with open(config_file, 'r') as f:
-    for line in f:
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
-        
-        parts = line.split('|')
-        
-        # Support 5, 6, or 7 field format
-        if len(parts) == 5:
-            # Old format: REPO_ID|REPO_URL|LABEL|DESCRIPTION|ENABLED
-            repo_id = parts[0].strip()
-            repo_url = parts[1].strip()
-            label = parts[2].strip()
-            description = parts[3].strip()
-            category = 'drivers'
-            display_mode = 'toplevel'
-            enabled = parts[4].strip().lower() == 'true'
-        elif len(parts) == 6:
-            # Medium format: REPO_ID|REPO_URL|LABEL|DESCRIPTION|CATEGORY|ENABLED
-            repo_id = parts[0].strip()
-            repo_url = parts[1].strip()
-            label = parts[2].strip()
-            description = parts[3].strip()
-            category = parts[4].strip()
-            display_mode = 'category'
-            enabled = parts[5].strip().lower() == 'true'
-        elif len(parts) == 7:
-            # New format: REPO_ID|REPO_URL|LABEL|DESCRIPTION|CATEGORY|DISPLAY_MODE|ENABLED
-            repo_id = parts[0].strip()
-            repo_url = parts[1].strip()
-            label = parts[2].strip()
-            description = parts[3].strip()
-            category = parts[4].strip()
-            display_mode = parts[5].strip()
-            enabled = parts[6].strip().lower() == 'true'
-        else:
-            print(f"⚠️  Skipping invalid line (expected 5, 6, or 7 fields): {line}")
-            continue
-        
-        # Remove .git suffix if present
-        github_url = repo_url.replace('.git', '')
-        
-        repos_data.append({
-            "id": repo_id,
-            "label": label,
-            "description": description,
-            "category": category,
-            "displayMode": display_mode,
-            "editUrl": f"{github_url}/tree/main/",
-            "githubUrl": github_url,
-            "enabled": enabled
-        })
-
-# Configuration with categories
-config = {
-    "repositories": repos_data,
-    "settings": {
-        "categories": [
-            {
-                "id": "drivers",
-                "label": "🔧 Hardware Drivers",
-                "icon": "🔧",
-                "description": "Low-level peripheral drivers for ESP32",
-                "position": "left"
-            },
-            {
-                "id": "projects",
-                "label": "🎵 Projects",
-                "icon": "🎵",
-                "description": "Complete IoT applications and examples",
-                "position": "left"
-            },
-            {
-                "id": "hardware",
-                "label": "🏗️ Hardware",
-                "icon": "🏗️",
-                "description": "PCB designs and 3D printable models",
-                "position": "left"
-            },
-            {
-                "id": "docs",
-                "label": "📚 Documentation",
-                "icon": "📚",
-                "description": "Guides, tutorials, and references",
-                "position": "left"
-            }
-        ],
-        "versioning": {
-            "enabled": True,
-            "showUnreleased": True,
-            "currentLabel": "Next",
-            "currentPath": "next"
-        },
-        "branding": {
-            "title": "WhirlingBits Documentation",
-            "tagline": "ESP-IDF Component Documentation",
-            "organizationName": "WhirlingBits"
-        }
-    }
-}
-
-# Write to docusaurus-config.json
-with open('docusaurus-config.json', 'w') as f:
-    json.dump(config, f, indent=2)
-
-# Summary
-print(f"✅ Generated config with {len(repos_data)} repositories")
-print(f"\n📊 Repositories by display mode:")
-
-toplevel_repos = [r for r in repos_data if r['displayMode'] == 'toplevel']
-category_repos = [r for r in repos_data if r['displayMode'] == 'category']
-
-if toplevel_repos:
-    print(f"\n   📌 Top-Level ({len(toplevel_repos)}):")
-    for repo in toplevel_repos:
-        status = "✅" if repo['enabled'] else "⏸️"
-        print(f"      {status} {repo['label']} ({repo['id']})")
-
-if category_repos:
-    print(f"\n   📁 In Categories ({len(category_repos)}):")
-    categories = {}
-    for repo in category_repos:
-        cat = repo['category']
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(repo)
-    
-    for cat, repos in sorted(categories.items()):
-        enabled_count = sum(1 for r in repos if r['enabled'])
-        print(f"\n      {cat}: {len(repos)} repos ({enabled_count} enabled)")
-        for repo in repos:
-            status = "✅" if repo['enabled'] else "⏸️"
-            print(f"         {status} {repo['label']}")
-
-PYTHON_END
+    python3 repo_config.py --config "$REPOS_CONFIG_FILE" config --output "$DOCUSAURUS_CONFIG_FILE"
     
     local py_exit=$?
     
@@ -324,7 +157,7 @@ cleanup_temp_files() {
     local cleaned=0
     
     if [ "$KEEP_DOXYGEN_OUTPUT" = false ]; then
-        for repo_name in "${!REPOS[@]}"; do
+        for repo_name in "${REPO_ORDER[@]}"; do
             local repo_dir="repos/$repo_name"
             if [ -d "$repo_dir/doxygen" ]; then
                 rm -rf "$repo_dir/doxygen"
@@ -345,6 +178,7 @@ cleanup_temp_files() {
     [ -f "${DOCUSAURUS_CONFIG_FILE}.backup" ] && rm -f "${DOCUSAURUS_CONFIG_FILE}.backup"
     [ -f "sidebars.js" ] && rm -f "sidebars.js" && ((cleaned++))
     [ -f "sidebars.json" ] && rm -f "sidebars.json" && ((cleaned++))
+    [ -f "$BUILD_MANIFEST_TMP" ] && rm -f "$BUILD_MANIFEST_TMP" && ((cleaned++))
     
     [ $cleaned -gt 0 ] && echo_info "✅ $cleaned cleanup operations"
 }
@@ -383,6 +217,49 @@ check_dependencies() {
     return 0
 }
 
+record_build_result() {
+    local repo_name=$1
+    local version=$2
+    local status=$3
+    local archive=${4:-false}
+    
+    local docs_dir sidebar_file
+    if [ "$version" = "current" ]; then
+        docs_dir="$repo_name"
+        sidebar_file="$repo_name/sidebars.json"
+    else
+        docs_dir="${repo_name}_versioned_docs/version-$version"
+        sidebar_file="${repo_name}_versioned_sidebars/version-$version-sidebars.json"
+    fi
+    
+    local archive_arg=""
+    [ "$archive" = true ] && archive_arg="--archived"
+    
+    python3 build_manifest.py --manifest "$BUILD_MANIFEST_TMP" record \
+        --repo "$repo_name" \
+        --version "$version" \
+        --status "$status" \
+        --docs-dir "$docs_dir" \
+        --sidebar "$sidebar_file" \
+        $archive_arg || echo_warn "Could not update $BUILD_MANIFEST_TMP"
+}
+
+finalize_page_manifest() {
+    local target_dir=$1
+    shift
+    
+    [ -f "$target_dir/manifest.json" ] || return 0
+    
+    # Re-hash after the sed passes so manifest.json matches the deployed files
+    local extra_args=()
+    for extra in "$@"; do
+        [ -f "$extra" ] && extra_args+=(--extra "$extra")
+    done
+    
+    python3 doxygen_to_markdown.py --finalize-manifest --output "$target_dir" "${extra_args[@]}" \
+        || echo_warn "Could not finalize $target_dir/manifest.json"
+}
+
 get_repo_versions() {
     local repo_name=$1
     local repo_dir="repos/$repo_name"
@@ -536,11 +413,12 @@ generate_sidebar_from_markdown() {
 
     local md_files=()
     while IFS= read -r -d '' file; do
-        local basename=$(basename "$file" .md)
+        local basename=$(basename "$file")
+        basename="${basename%.*}"
         [ "$basename" = "index" ] && continue
         [ "$basename" = "versions" ] && continue
         md_files+=("$basename")
-    done < <(find "$target_dir" -maxdepth 1 -type f -name "*.md" -print0 2>/dev/null)
+    done < <(find "$target_dir" -maxdepth 1 -type f \( -name "*.md" -o -name "*.mdx" \) -print0 2>/dev/null)
     
     IFS=$'\n' md_files=($(sort <<<"${md_files[*]}"))
     unset IFS
@@ -609,6 +487,8 @@ used_files = set()
 sidebar_items = []
 
 def get_frontmatter_title(file_path):
+    if not os.path.exists(file_path) and os.path.exists(file_path + 'x'):
+        file_path += 'x'
     try:
         with open(file_path, 'r') as f:
             lines = f.readlines()
@@ -719,8 +599,10 @@ PYTHON_EOF
                 first=false
 
                 local label="$md_file"
-                if [ -f "$target_dir/$md_file.md" ]; then
-                    local frontmatter_label=$(sed -n '/^---$/,/^---$/p' "$target_dir/$md_file.md" | grep '^title:' | sed 's/^title: *//' | sed 's/^["'\'']//' | sed 's/["'\'']$//')
+                local md_path="$target_dir/$md_file.md"
+                [ -f "$md_path" ] || md_path="$target_dir/$md_file.mdx"
+                if [ -f "$md_path" ]; then
+                    local frontmatter_label=$(sed -n '/^---$/,/^---$/p' "$md_path" | grep '^title:' | sed 's/^title: *//' | sed 's/^["'\'']//' | sed 's/["'\'']$//')
                     [ -n "$frontmatter_label" ] && label="$frontmatter_label"
                 fi
                 
@@ -759,6 +641,7 @@ process_repo() {
     local repo_name=$1
     local repo_url=$2
     local version=${3:-"current"}
+    local archive=${4:-false}
     
     [ "${REPOS_ENABLED[$repo_name]}" != "true" ] && echo_warn "Skipping $repo_name" && return 0
     
@@ -771,40 +654,19 @@ process_repo() {
     
     local repo_dir="repos/$repo_name"
     
-    if [ -d "$repo_dir" ]; then
-        cd "$repo_dir" || return 1
-        git fetch --all --tags --quiet 2>/dev/null || true
-        cd - > /dev/null || return 1
-    else
-        mkdir -p repos
-        if ! git clone "$repo_url" "$repo_dir"; then
+    if [ ! -d "$repo_dir/.git" ]; then
+        if ! python3 repo_fetch.py --dir "$repo_dir" fetch --url "$repo_url"; then
             echo_error "Clone failed"
             return 1
         fi
     fi
     
-    cd "$repo_dir" || return 1
-    
-    local git_tag
-    if [ "$version" = "current" ]; then
-        if ! git checkout main 2>/dev/null && ! git checkout master 2>/dev/null; then
-            echo_error "No main/master branch found"
-            cd - > /dev/null || return 1
-            return 1
-        fi
-        git pull --quiet 2>/dev/null || true
-        git_tag="current"
-    else
-        git_tag="v${version}"
-        if ! git checkout "tags/$git_tag" --quiet 2>/dev/null; then
-            echo_error "Tag $git_tag not found"
-            cd - > /dev/null || return 1
-            return 1
-        fi
+    # Sparse checkout limited to the Doxyfile inputs of this version
+    if ! python3 repo_fetch.py --dir "$repo_dir" checkout --version "$version"; then
+        echo_error "Checkout of $version failed"
+        return 1
     fi
     
-    cd - > /dev/null || return 1
-    
     if [ ! -f "$repo_dir/Doxyfile" ]; then
         echo_error "Doxyfile not found"
         return 1
@@ -847,12 +709,24 @@ process_repo() {
         echo_debug "Using DoxygenLayout.xml for structure"
     fi
     
+    local archive_arg=""
+    if [ "$archive" = true ]; then
+        archive_arg="--archive"
+        [ "$ARCHIVE_SKIP_DIAGRAMS" = true ] && archive_arg="$archive_arg --skip-diagrams"
+        echo_debug "Archive mode: compact group pages"
+        # Same doc ids as the full pages; drop pages of groups that no longer exist
+        rm -f "$target_dir"/*.md "$target_dir"/*.mdx 2>/dev/null
+    fi
+    
     local py_output
     py_output=$(python3 doxygen_to_markdown.py \
         --xml-dir "$repo_dir/doxygen/xml" \
         --output "$target_dir" \
         --format docusaurus \
-        $layout_arg 2>&1)
+        --doc-version "$version" \
+        --table-threshold "$TABLE_VIRTUALIZE_THRESHOLD" \
+        --lazy-mermaid "$LAZY_MERMAID_THRESHOLD" \
+        $layout_arg $archive_arg 2>&1)
     local py_exit=$?
     
     echo "$py_output" | grep -v "Processing"
@@ -902,7 +776,20 @@ process_repo() {
         -e 's/<a href="#[^"]*">More\.\.\.<\/a>//g' \
         {} + 2>/dev/null
     
-    generate_sidebar_from_markdown "$target_dir" "$repo_name" "$version"
+    if [ "$archive" = true ]; then
+        # Archived versions keep the flat summary sidebar written by the converter
+        mkdir -p "${repo_name}_versioned_sidebars"
+        cp "$target_dir/sidebars.json" "${repo_name}_versioned_sidebars/version-$version-sidebars.json"
+        echo_info "✅ Archived sidebar: ${repo_name}_versioned_sidebars/version-$version-sidebars.json"
+    else
+        generate_sidebar_from_markdown "$target_dir" "$repo_name" "$version"
+    fi
+    
+    if [ "$version" = "current" ]; then
+        finalize_page_manifest "$target_dir" "$repo_name/sidebars.json" "$repo_name/versions.md"
+    else
+        finalize_page_manifest "$target_dir" "${repo_name}_versioned_sidebars/version-$version-sidebars.json"
+    fi
     
     echo_info "✅ $label ($version): $md_count modules"
     return 0
@@ -919,12 +806,14 @@ main() {
     load_repositories || exit 1
     generate_docusaurus_config || exit 1
     
+    python3 build_manifest.py --manifest "$BUILD_MANIFEST_TMP" reset || exit 1
+    
     mkdir -p repos
     
     local success=0
     local failed=0
     
-    for repo_name in "${!REPOS[@]}"; do
+    for repo_name in "${REPO_ORDER[@]}"; do
         [ "${REPOS_ENABLED[$repo_name]}" != "true" ] && continue
         
         repo_url="${REPOS[$repo_name]}"
@@ -935,16 +824,15 @@ main() {
         local all_versions=""
         local released_versions=""
         
+        # One blobless clone per repo, shared by all version checkouts
+        local repo_dir="repos/$repo_name"
+        if ! python3 repo_fetch.py --dir "$repo_dir" fetch --url "$repo_url"; then
+            echo_error "❌ Fetching $repo_name failed"
+            ((failed++))
+            continue
+        fi
+        
         if [ "$ENABLE_VERSIONING" = true ]; then
-            local repo_dir="repos/$repo_name"
-            if [ ! -d "$repo_dir" ]; then
-                echo_debug "Cloning $repo_name for version detection..."
-                if ! git clone "$repo_url" "$repo_dir"; then
-                    ((failed++))
-                    continue
-                fi
-            fi
-            
             local git_versions=$(get_repo_versions "$repo_name")
             
             if [ -n "$git_versions" ]; then
@@ -962,26 +850,43 @@ main() {
         
         echo_debug "Processing versions: $all_versions"
         
+        local converted_versions=""
+        local released_index=0
         for version in $all_versions; do
-            if process_repo "$repo_name" "$repo_url" "$version"; then
+            local archive=false
+            if [ "$version" != "current" ]; then
+                if [ "$ARCHIVE_AFTER_VERSIONS" -gt 0 ] && [ $released_index -ge "$ARCHIVE_AFTER_VERSIONS" ]; then
+                    archive=true
+                fi
+                released_index=$((released_index + 1))
+            fi
+            
+            if process_repo "$repo_name" "$repo_url" "$version" "$archive"; then
                 ((success++))
+                record_build_result "$repo_name" "$version" success "$archive"
+                [ "$version" != "current" ] && converted_versions="$converted_versions $version"
             else
                 echo_error "❌ Error in $repo_name ($version)"
                 ((failed++))
+                record_build_result "$repo_name" "$version" failed "$archive"
             fi
         done
 
         if [ -n "$released_versions" ]; then
-            echo_debug "Creating versions.json with: $released_versions"
-            create_versions_json "$repo_name" "$released_versions"
+            # Only versions whose conversion succeeded end up in versions.json
+            echo_debug "Creating versions.json with: $converted_versions"
+            create_versions_json "$repo_name" "$converted_versions"
             
             echo_debug "Creating versions.md for: $repo_name"
-            create_versions_page "$repo_name" "current $released_versions"
+            create_versions_page "$repo_name" "current $converted_versions"
+            finalize_page_manifest "$repo_name" "$repo_name/sidebars.json" "$repo_name/versions.md"
         else
             echo_debug "No released versions - skipping versions.json and versions.md"
         fi
     done
     
+    mv -f "$BUILD_MANIFEST_TMP" "$BUILD_MANIFEST_FILE" || echo_warn "Could not update $BUILD_MANIFEST_FILE"
+    
     echo ""
     echo "═══════════════════════════════════════════════════"
     echo_info "📊 Build Statistics:"
@@ -991,7 +896,7 @@ main() {
 
     echo ""
     echo_info "🎯 Multi-Instance Structure (with Categories):"
-    for repo_name in "${!REPOS[@]}"; do
+    for repo_name in "${REPO_ORDER[@]}"; do
         [ "${REPOS_ENABLED[$repo_name]}" != "true" ] && continue
         
         local display_mode="${REPOS_DISPLAY_MODE[$repo_name]}"
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+repositories.conf Loader
+Parst und validiert repositories.conf einmalig, erzeugt docusaurus-config.json
+und den Job-Plan für generate-docs.sh
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DISPLAY_MODES = ('toplevel', 'category')
+
+PLAN_SEPARATOR = '\x1f'
+
+CATEGORIES: List[Dict[str, str]] = [
+    {
+        'id': 'drivers',
+        'label': '🔧 Hardware Drivers',
+        'icon': '🔧',
+        'description': 'Low-level peripheral drivers for ESP32',
+        'position': 'left',
+    },
+    {
+        'id': 'projects',
+        'label': '🎵 Projects',
+        'icon': '🎵',
+        'description': 'Complete IoT applications and examples',
+        'position': 'left',
+    },
+    {
+        'id': 'hardware',
+        'label': '🏗️ Hardware',
+        'icon': '🏗️',
+        'description': 'PCB designs and 3D printable models',
+        'position': 'left',
+    },
+    {
+        'id': 'docs',
+        'label': '📚 Documentation',
+        'icon': '📚',
+        'description': 'Guides, tutorials, and references',
+        'position': 'left',
+    },
+]
+
+SETTINGS: Dict[str, Any] = {
+    'categories': CATEGORIES,
+    'versioning': {
+        'enabled': True,
+        'showUnreleased': True,
+        'currentLabel': 'Next',
+        'currentPath': 'next',
+    },
+    'branding': {
+        'title': 'WhirlingBits Documentation',
+        'tagline': 'ESP-IDF Component Documentation',
+        'organizationName': 'WhirlingBits',
+    },
+}
+
+# Parser-Version im Cache-Key: Änderungen an Parsing/Validierung verwerfen alte Caches
+PARSER_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+class RepositoryConfigParser:
+    """Parst repositories.conf im 4-, 5-, 6- oder 7-Feld-Format"""
+
+    def __init__(self, config_file: Path):
+        self.config_file = config_file
+        self.warnings: List[str] = []
+
+    def parse(self) -> List[Dict[str, Any]]:
+        repositories: List[Dict[str, Any]] = []
+        seen: Dict[str, int] = {}
+
+        with open(self.config_file, 'r', encoding='utf-8') as f:
+            for line_no, raw_line in enumerate(f, start=1):
+                line = raw_line.strip()
+                if not line or line.startswith('#'):
+                    continue
+
+                repo = self._parse_line(line, line_no)
+                if repo is None:
+                    continue
+
+                if repo['id'] in seen:
+                    self._warn(line_no, f"duplicate id '{repo['id']}' (first defined in line {seen[repo['id']]})")
+                    continue
+
+                seen[repo['id']] = line_no
+                repositories.append(repo)
+
+        return repositories
+
+    def _parse_line(self, line: str, line_no: int) -> Optional[Dict[str, Any]]:
+        parts = [part.strip() for part in line.split('|')]
+
+        if len(parts) == 4:
+            # Minimal format: REPO_ID|REPO_URL|LABEL|DESCRIPTION
+            repo_id, repo_url, label, description = parts
+            category, display_mode, enabled = 'drivers', 'toplevel', 'true'
+        elif len(parts) == 5:
+            # Old format: REPO_ID|REPO_URL|LABEL|DESCRIPTION|ENABLED
+            repo_id, repo_url, label, description, enabled = parts
+            category, display_mode = 'drivers', 'toplevel'
+        elif len(parts) == 6:
+            # Medium format: REPO_ID|REPO_URL|LABEL|DESCRIPTION|CATEGORY|ENABLED
+            repo_id, repo_url, label, description, category, enabled = parts
+            display_mode = 'category'
+        elif len(parts) == 7:
+            # New format: REPO_ID|REPO_URL|LABEL|DESCRIPTION|CATEGORY|DISPLAY_MODE|ENABLED
+            repo_id, repo_url, label, description, category, display_mode, enabled = parts
+        else:
+            self._warn(line_no, f"expected 4, 5, 6, or 7 fields, got {len(parts)}")
+            return None
+
+        if not re.fullmatch(r'[A-Za-z0-9._-]+', repo_id):
+            self._warn(line_no, f"invalid repository id '{repo_id}'")
+            return None
+
+        if not repo_url:
+            self._warn(line_no, f"{repo_id} has no URL")
+            return None
+
+        enabled = enabled.lower() or 'true'
+        if enabled not in ('true', 'false'):
+            self._warn(line_no, f"{repo_id}: ENABLED must be true or false, got '{enabled}'")
+            return None
+
+        display_mode = display_mode or 'category'
+        if display_mode not in DISPLAY_MODES:
+            self._warn(line_no, f"{repo_id}: unknown display mode '{display_mode}'")
+            return None
+
+        category = category or 'drivers'
+        if category not in {c['id'] for c in CATEGORIES}:
+            self._warn(line_no, f"{repo_id}: unknown category '{category}'", skipped=False)
+
+        if not label:
+            label = re.sub(r'^wb-idf-', '', repo_id).replace('-', ' ').title()
+
+        if not description:
+            description = f"Documentation for {label}"
+
+        github_url = repo_url[:-len('.git')] if repo_url.endswith('.git') else repo_url
+
+        return {
+            'id': repo_id,
+            'cloneUrl': f"{github_url}.git",
+            'githubUrl': github_url,
+            'label': label,
+            'description': description,
+            'category': category,
+            'displayMode': display_mode,
+            'enabled': enabled == 'true',
+        }
+
+    def _warn(self, line_no: int, message: str, skipped: bool = True):
+        """skipped=False: Zeile wird trotz Warnung übernommen"""
+        prefix = "Skipping" if skipped else "Warning"
+        self.warnings.append(f"{prefix}: {self.config_file.name}:{line_no}: {message}")
+
+
+def default_cache_file(config_file: Path) -> Path:
+    return config_file.parent / f".{config_file.name}.cache.json"
+
+
+def load_repositories(config_file: Path, cache_file: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """Lädt repositories.conf, gecacht über mtime, Dateigröße und Parser-Version.
+
+    Warnungen werden mitgecacht und bei jedem Laden erneut ausgegeben.
+    """
+    stat = config_file.stat()
+    key = (stat.st_mtime_ns, stat.st_size, PARSER_DIGEST)
+
+    if cache_file is None:
+        cache_file = default_cache_file(config_file)
+
+    repositories: Optional[List[Dict[str, Any]]] = None
+    warnings: List[str] = []
+    if cache_file.exists():
+        try:
+            cached = json.loads(cache_file.read_text(encoding='utf-8'))
+            if (cached.get('mtime_ns'), cached.get('size'), cached.get('parser')) == key:
+                repositories = cached['repositories']
+                warnings = cached['warnings']
+        except (ValueError, KeyError, TypeError):
+            repositories = None
+
+    if repositories is None:
+        parser = RepositoryConfigParser(config_file)
+        repositories = parser.parse()
+        warnings = parser.warnings
+
+        try:
+            cache_file.write_text(json.dumps({
+                'mtime_ns': key[0],
+                'size': key[1],
+                'parser': key[2],
+                'repositories': repositories,
+                'warnings': warnings,
+            }, ensure_ascii=False), encoding='utf-8')
+        except OSError as e:
+            print(f"⚠️  Warning: Could not write cache {cache_file}: {e}", file=sys.stderr)
+
+    for warning in warnings:
+        print(f"⚠️  {warning}", file=sys.stderr)
+
+    return repositories
+
+
+def build_docusaurus_config(repositories: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        'repositories': [
+            {
+                'id': repo['id'],
+                'label': repo['label'],
+                'description': repo['description'],
+                'category': repo['category'],
+                'displayMode': repo['displayMode'],
+                'editUrl': f"{repo['githubUrl']}/tree/main/",
+                'githubUrl': repo['githubUrl'],
+                'enabled': repo['enabled'],
+            }
+            for repo in repositories
+        ],
+        'settings': SETTINGS,
+    }
+
+
+def write_docusaurus_config(repositories: List[Dict[str, Any]], output_file: Path):
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(build_docusaurus_config(repositories), f, indent=2)
+
+    print(f"✅ Generated config with {len(repositories)} repositories")
+    print("\n📊 Repositories by display mode:")
+
+    toplevel_repos = [r for r in repositories if r['displayMode'] == 'toplevel']
+    category_repos = [r for r in repositories if r['displayMode'] == 'category']
+
+    if toplevel_repos:
+        print(f"\n   📌 Top-Level ({len(toplevel_repos)}):")
+        for repo in toplevel_repos:
+            status = "✅" if repo['enabled'] else "⏸️"
+            print(f"      {status} {repo['label']} ({repo['id']})")
+
+    if category_repos:
+        print(f"\n   📁 In Categories ({len(category_repos)}):")
+        categories: Dict[str, List[Dict[str, Any]]] = {}
+        for repo in category_repos:
+            categories.setdefault(repo['category'], []).append(repo)
+
+        for cat, repos in sorted(categories.items()):
+            enabled_count = sum(1 for r in repos if r['enabled'])
+            print(f"\n      {cat}: {len(repos)} repos ({enabled_count} enabled)")
+            for repo in repos:
+                status = "✅" if repo['enabled'] else "⏸️"
+                print(f"         {status} {repo['label']}")
+
+
+def format_plan(repositories: List[Dict[str, Any]], fmt: str) -> str:
+    """Job-Plan in Konfigurationsreihenfolge (tsv für generate-docs.sh, json für Tools)"""
+    if fmt == 'json':
+        return json.dumps({'jobs': repositories}, indent=2, ensure_ascii=False)
+
+    fields = ('id', 'cloneUrl', 'label', 'description', 'category', 'displayMode', 'enabled')
+    lines = []
+    for repo in repositories:
+        values = [str(repo[field]).lower() if field == 'enabled' else str(repo[field]) for field in fields]
+        lines.append(PLAN_SEPARATOR.join(value.replace(PLAN_SEPARATOR, ' ') for value in values))
+    return '\n'.join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Parse repositories.conf for the documentation build')
+    parser.add_argument('--config', default='repositories.conf', help='Repository configuration file')
+    parser.add_argument('--cache', help='Parse cache file (default: .<config>.cache.json)')
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    config_parser = subparsers.add_parser('config', help='Write docusaurus-config.json')
+    config_parser.add_argument('--output', default='docusaurus-config.json', help='Output file')
+
+    plan_parser = subparsers.add_parser('plan', help='Print the job plan')
+    plan_parser.add_argument('--format', choices=['tsv', 'json'], default='tsv', help='Plan format')
+
+    args = parser.parse_args()
+
+    config_file = Path(args.config)
+    if not config_file.exists():
+        print(f"❌ Error: {config_file} not found", file=sys.stderr)
+        return 1
+
+    repositories = load_repositories(config_file, Path(args.cache) if args.cache else None)
+
+    if args.command == 'config':
+        write_docusaurus_config(repositories, Path(args.output))
+    else:
+        plan = format_plan(repositories, args.format)
+        if plan:
+            print(plan)
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Repository Fetcher für die Doku-Generierung
+Blobless Partial Clone + Sparse Checkout auf die Doxygen-Inputs (INPUT/FILE_PATTERNS)
+"""
+
+import argparse
+import re
+import shlex
+import subprocess
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Immer benötigte Dateien (relativ zum Repository-Root)
+ALWAYS_INCLUDED = ['/Doxyfile', '/DoxygenLayout.xml']
+
+DEFAULT_BRANCHES = ['main', 'master']
+
+# Doxyfile-Keys mit Dateien/Verzeichnissen aus dem Repository, die Doxygen liest
+PATH_KEYS = (
+    'IMAGE_PATH', 'LAYOUT_FILE', 'USE_MDFILE_AS_MAINPAGE', 'CITE_BIB_FILES', 'TAGFILES',
+    'INCLUDE_PATH', 'DOTFILE_DIRS', 'MSCFILE_DIRS', 'DIAFILE_DIRS', 'PLANTUML_INCLUDE_PATH', 'PLANTUML_CFG_FILE',
+    'HTML_HEADER', 'HTML_FOOTER', 'HTML_STYLESHEET', 'HTML_EXTRA_STYLESHEET', 'HTML_EXTRA_FILES',
+    'LATEX_HEADER', 'LATEX_FOOTER', 'LATEX_EXTRA_STYLESHEET', 'LATEX_EXTRA_FILES',
+    'RTF_STYLESHEET_FILE', 'RTF_EXTENSIONS_FILE', 'FORMULA_MACROFILE', 'MATHJAX_CODEFILE', 'LATEX_EMOJI_DIRECTORY',
+)
+
+# Doxyfile-Keys mit Filter-Kommandos; in-Repo-Skripte müssen mit ausgecheckt werden
+FILTER_KEYS = ('INPUT_FILTER', 'FILTER_PATTERNS', 'FILTER_SOURCE_PATTERNS', 'FILE_VERSION_FILTER')
+
+# Pfad-Keys, die auf Ausgaben oder externe Tools zeigen und nichts aus dem Repository brauchen
+EXTERNAL_PATH_KEYS = (
+    'STRIP_FROM_PATH', 'STRIP_FROM_INC_PATH', 'GENERATE_TAGFILE', 'DOT_PATH', 'PLANTUML_JAR_PATH',
+    'MSCGEN_PATH', 'DIA_PATH', 'PERL_PATH', 'CHM_FILE', 'QCH_FILE', 'SEARCHDATA_FILE',
+)
+
+# Unbekannte Keys mit dieser Endung können Pfade enthalten → ganzer Baum
+PATH_KEY_SUFFIX = re.compile(r'_(PATH|FILE|FILES|DIRS|FILTER)$')
+
+MAX_INCLUDE_DEPTH = 8
+
+# (Dateiname, @INCLUDE_PATH) → (aufgelöster Pfad, Inhalt) oder None
+IncludeLoader = Callable[[str, List[str]], Optional[Tuple[str, str]]]
+
+
+class GitError(Exception):
+    """Git-Aufruf fehlgeschlagen"""
+
+
+def parse_doxyfile(content: str, include_loader: Optional[IncludeLoader] = None) -> Dict[str, List[str]]:
+    """Parst Doxyfile-Inhalt in KEY → Werte (inkl. '+=' und '\\'-Fortsetzungen).
+
+    Mit include_loader werden @INCLUDE-Dateien an ihrer Position mit ausgewertet.
+    """
+    values: Dict[str, List[str]] = {}
+    _apply_doxyfile(content, values, include_loader, 0)
+    return values
+
+
+def _apply_doxyfile(content: str, values: Dict[str, List[str]], include_loader: Optional[IncludeLoader],
+                    depth: int):
+    logical_lines: List[str] = []
+    current = ''
+    for line in content.splitlines():
+        stripped = line.strip()
+        if not current and (not stripped or stripped.startswith('#')):
+            continue
+        if stripped.endswith('\\'):
+            current += stripped[:-1] + ' '
+            continue
+        logical_lines.append(current + stripped)
+        current = ''
+    if current:
+        logical_lines.append(current)
+
+    for line in logical_lines:
+        if line.startswith('@'):
+            match = re.match(r'^(@INCLUDE|@INCLUDE_PATH)\s*=\s*(.*)$', line)
+            if not match:
+                continue
+            key, raw = match.groups()
+            if key == '@INCLUDE_PATH':
+                values.setdefault(key, []).extend(_split_values(raw))
+                continue
+
+            for name in _split_values(raw):
+                loaded = include_loader(name, values.get('@INCLUDE_PATH', [])) if include_loader else None
+                values.setdefault('@INCLUDE', []).append(loaded[0] if loaded else name)
+                if loaded and depth < MAX_INCLUDE_DEPTH:
+                    _apply_doxyfile(loaded[1], values, include_loader, depth + 1)
+            continue
+
+        match = re.match(r'^([A-Za-z0-9_]+)\s*(\+?=)\s*(.*)$', line)
+        if not match:
+            continue
+
+        key, operator, raw = match.groups()
+        tokens = _split_values(raw)
+        if operator == '+=':
+            values.setdefault(key, []).extend(tokens)
+        else:
+            values[key] = tokens
+
+
+def _split_values(raw: str) -> List[str]:
+    try:
+        tokens = shlex.split(raw, comments=False, posix=True)
+    except ValueError:
+        tokens = raw.split()
+    return [token for token in tokens if token]
+
+
+class RepositoryFetcher:
+    """Blobless Clone eines Repositories mit Sparse Checkout pro Version"""
+
+    def __init__(self, repo_dir: Path):
+        self.repo_dir = repo_dir
+
+    def fetch(self, url: str):
+        """Klont (blobless, ohne Checkout) oder aktualisiert Branches und Tags"""
+        if (self.repo_dir / '.git').exists():
+            self._git('fetch', '--tags', '--prune', '--force', '--quiet', 'origin')
+            print(f"   ✅ Fetched {self.repo_dir}")
+            return
+
+        self.repo_dir.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self._run(['git', 'clone', '--filter=blob:none', '--no-checkout', '--quiet', url, str(self.repo_dir)])
+        except GitError as e:
+            print(f"   ⚠️  Partial clone failed, falling back to full clone: {e}")
+            self._run(['git', 'clone', '--no-checkout', '--quiet', url, str(self.repo_dir)])
+
+        self._git('sparse-checkout', 'set', '--no-cone', *ALWAYS_INCLUDED)
+        print(f"   ✅ Cloned {url} → {self.repo_dir} (blobless, sparse)")
+
+    def resolve(self, version: str) -> str:
+        """'current' → origin/main bzw. origin/master, sonst Tag v<version>"""
+        if version == 'current':
+            candidates = [f"refs/remotes/origin/{branch}" for branch in DEFAULT_BRANCHES]
+        else:
+            tag = version if version.startswith('v') else f"v{version}"
+            candidates = [f"refs/tags/{tag}"]
+
+        for ref in candidates:
+            if self._git_ok('rev-parse', '--verify', '--quiet', f"{ref}^{{commit}}"):
+                return ref
+
+        raise GitError(f"No ref found for version '{version}' (tried {', '.join(candidates)})")
+
+    def checkout(self, version: str) -> List[str]:
+        """Checkt die Version aus, beschränkt auf Doxyfile-Inputs. Gibt die Sparse-Patterns zurück"""
+        ref = self.resolve(version)
+
+        doxyfile = self._git_output('show', f"{ref}:Doxyfile", check=False)
+        if doxyfile is None:
+            patterns: Optional[List[str]] = list(ALWAYS_INCLUDED)
+        else:
+            patterns = self.sparse_patterns(ref, parse_doxyfile(doxyfile, self._include_loader(ref)))
+
+        if patterns is None:
+            self._git('sparse-checkout', 'disable')
+        else:
+            self._git('sparse-checkout', 'set', '--no-cone', *patterns)
+
+        self._git('checkout', '--quiet', '--force', '--detach', ref)
+        print(f"   ✅ Checked out {ref} ({'full tree' if patterns is None else f'{len(patterns)} sparse patterns'})")
+        return patterns or []
+
+    def sparse_patterns(self, ref: str, doxyfile: Dict[str, List[str]]) -> Optional[List[str]]:
+        """Sparse-Checkout-Patterns für die Doxyfile-Inputs; None = ganzer Baum nötig"""
+        inputs = doxyfile.get('INPUT', [])
+        if not inputs:
+            # Leeres INPUT = Verzeichnis des Doxyfile (Repository-Root)
+            return None
+
+        unknown = sorted(key for key, tokens in doxyfile.items()
+                         if tokens and not key.startswith('@') and PATH_KEY_SUFFIX.search(key)
+                         and key not in PATH_KEYS + FILTER_KEYS + EXTERNAL_PATH_KEYS + ('EXAMPLE_PATH',))
+        if unknown:
+            print(f"   ⚠️  Unhandled path settings {', '.join(unknown)}, checking out the full tree")
+            return None
+
+        file_patterns = doxyfile.get('FILE_PATTERNS', [])
+        recursive = (doxyfile.get('RECURSIVE', ['NO']) or ['NO'])[0].upper() == 'YES'
+
+        patterns: List[str] = list(ALWAYS_INCLUDED)
+
+        def add(pattern: str):
+            if pattern not in patterns:
+                patterns.append(pattern)
+
+        def add_path(normalized: str):
+            add(f"/{normalized}/" if self._object_type(ref, normalized) == 'tree' else f"/{normalized}")
+
+        for path in inputs:
+            normalized = self._normalize(path)
+            if normalized is None:
+                continue
+            if normalized == '':
+                return None
+
+            if self._object_type(ref, normalized) == 'tree':
+                if not file_patterns:
+                    add(f"/{normalized}/")
+                for file_pattern in file_patterns:
+                    if recursive:
+                        add(f"/{normalized}/**/{file_pattern}")
+                    else:
+                        add(f"/{normalized}/{file_pattern}")
+            else:
+                add(f"/{normalized}")
+
+        example_patterns = doxyfile.get('EXAMPLE_PATTERNS', [])
+        for path in doxyfile.get('EXAMPLE_PATH', []):
+            normalized = self._normalize(path)
+            if not normalized:
+                continue
+            if self._object_type(ref, normalized) == 'tree' and example_patterns:
+                # \include darf Unterpfade nennen, daher unabhängig von EXAMPLE_RECURSIVE rekursiv
+                for example_pattern in example_patterns:
+                    add(f"/{normalized}/**/{example_pattern}")
+            else:
+                add_path(normalized)
+
+        for key in PATH_KEYS:
+            for path in doxyfile.get(key, []):
+                # TAGFILES: datei=url
+                normalized = self._normalize(path.split('=', 1)[0] if key == 'TAGFILES' else path)
+                if normalized:
+                    add_path(normalized)
+
+        for key in FILTER_KEYS:
+            for value in doxyfile.get(key, []):
+                # FILTER_PATTERNS: muster=kommando
+                command = value.split('=', 1)[1] if key.startswith('FILTER_') and '=' in value else value
+                for token in _split_values(command):
+                    normalized = self._normalize(token)
+                    if normalized and self._object_type(ref, normalized) is not None:
+                        add_path(normalized)
+
+        include_paths = [path for path in map(self._normalize, doxyfile.get('@INCLUDE_PATH', [])) if path]
+        for path in doxyfile.get('@INCLUDE', []):
+            normalized = self._normalize(path)
+            if normalized:
+                add(f"/{normalized}")
+                for include_path in include_paths:
+                    add(f"/{include_path}/{normalized}")
+
+        return patterns
+
+    def _include_loader(self, ref: str) -> IncludeLoader:
+        """Lädt @INCLUDE-Dateien aus dem Ref (relativ zum Root oder zu @INCLUDE_PATH)"""
+        def load(name: str, include_paths: List[str]) -> Optional[Tuple[str, str]]:
+            for candidate in [name] + [f"{path}/{name}" for path in include_paths]:
+                normalized = self._normalize(candidate)
+                if not normalized:
+                    continue
+                content = self._git_output('show', f"{ref}:{normalized}", check=False)
+                if content is not None:
+                    return normalized, content
+            return None
+
+        return load
+
+    def _normalize(self, path: str) -> Optional[str]:
+        """Pfad relativ zum Repository-Root; None für absolute/externe Pfade"""
+        path = path.replace('\\', '/').strip()
+        if path.startswith('/') or path.startswith('..'):
+            return None
+        parts = [part for part in path.split('/') if part not in ('', '.')]
+        if '..' in parts:
+            return None
+        return '/'.join(parts)
+
+    def _object_type(self, ref: str, path: str) -> Optional[str]:
+        return self._git_output('cat-file', '-t', f"{ref}:{path}", check=False)
+
+    def _git(self, *args: str):
+        self._run(['git', '-C', str(self.repo_dir), *args])
+
+    def _git_ok(self, *args: str) -> bool:
+        return subprocess.run(['git', '-C', str(self.repo_dir), *args], capture_output=True).returncode == 0
+
+    def _git_output(self, *args: str, check: bool = True) -> Optional[str]:
+        result = subprocess.run(['git', '-C', str(self.repo_dir), *args], capture_output=True, text=True)
+        if result.returncode != 0:
+            if check:
+                raise GitError(result.stderr.strip())
+            return None
+        return result.stdout.strip()
+
+    def _run(self, cmd: List[str]):
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise GitError(f"{' '.join(cmd[:4])}: {result.stderr.strip()}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Fetch repositories for the documentation build')
+    parser.add_argument('--dir', required=True, help='Local repository directory')
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    fetch_parser = subparsers.add_parser('fetch', help='Blobless clone or fetch of branches and tags')
+    fetch_parser.add_argument('--url', required=True, help='Repository URL')
+
+    checkout_parser = subparsers.add_parser('checkout', help='Sparse checkout of one version')
+    checkout_parser.add_argument('--version', default='current', help="'current' or release version (tag v<version>)")
+
+    args = parser.parse_args()
+
+    fetcher = RepositoryFetcher(Path(args.dir))
+
+    try:
+        if args.command == 'fetch':
+            fetcher.fetch(args.url)
+        else:
+            fetcher.checkout(args.version)
+    except GitError as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,69 @@
+import {useEffect, useRef, useState, type ReactNode} from 'react';
+import Mermaid from '@theme/Mermaid';
+import useSidecarData from '@site/src/hooks/useSidecarData';
+import styles from './styles.module.css';
+
+// Sidecar file written by doxygen_to_markdown.py (--lazy-mermaid)
+type DiagramData = {
+  source: string;
+  lines: number;
+  edges: number;
+};
+
+type LazyMermaidProps = {
+  load: () => Promise<DiagramData | {default: DiagramData}>;
+  lines: number;
+  edges: number;
+};
+
+// Reserve roughly the rendered size so the page does not jump while scrolling
+function estimateHeight(lines: number, edges: number): number {
+  return Math.min(800, 80 + 24 * Math.max(lines, edges));
+}
+
+export default function LazyMermaid({load, lines, edges}: LazyMermaidProps): ReactNode {
+  const ref = useRef<HTMLDivElement>(null);
+  const [visible, setVisible] = useState(false);
+  const {data, error} = useSidecarData(load, visible);
+
+  useEffect(() => {
+    const node = ref.current;
+    if (!node || visible) {
+      return undefined;
+    }
+    if (typeof IntersectionObserver === 'undefined') {
+      setVisible(true);
+      return undefined;
+    }
+
+    const observer = new IntersectionObserver(
+      entries => {
+        if (entries.some(entry => entry.isIntersecting)) {
+          setVisible(true);
+          observer.disconnect();
+        }
+      },
+      {rootMargin: '200px'},
+    );
+    observer.observe(node);
+    return () => observer.disconnect();
+  }, [visible]);
+
+  if (error) {
+    return <div className={styles.placeholder}>Could not load diagram: {error}</div>;
+  }
+
+  if (data) {
+    return <Mermaid value={data.source} />;
+  }
+
+  return (
+    <div
+      ref={ref}
+      className={styles.placeholder}
+      style={{minHeight: estimateHeight(lines, edges)}}
+      aria-busy="true">
+      Diagram ({lines} lines) loads when scrolled into view…
+    </div>
+  );
+}
@@ -0,0 +1,193 @@
+import {Fragment, useEffect, useMemo, useRef, useState, type ReactNode, type UIEvent} from 'react';
+import clsx from 'clsx';
+import Link from '@docusaurus/Link';
+import useIsomorphicLayoutEffect from '@docusaurus/useIsomorphicLayoutEffect';
+import useSidecarData from '@site/src/hooks/useSidecarData';
+import styles from './styles.module.css';
+
+// Inline Markdown of a cell, pre-rendered by doxygen_to_markdown.py
+type Run = {
+  text: string;
+  code?: boolean;
+  bold?: boolean;
+  em?: boolean;
+  href?: string;
+};
+
+// Data file written by doxygen_to_markdown.py (--table-threshold)
+type TableData = {
+  columns: string[];
+  rows: Run[][][];
+};
+
+type VirtualTableProps = {
+  load: () => Promise<TableData | {default: TableData}>;
+  rows: number;
+  rowHeight?: number;
+  visibleRows?: number;
+};
+
+const OVERSCAN = 8;
+
+// Row height estimate until a row has been rendered and measured
+const CHARS_PER_LINE = 40;
+const LINE_HEIGHT = 24;
+const ROW_PADDING = 12;
+
+function renderRun(run: Run, idx: number): ReactNode {
+  let node: ReactNode = run.text;
+  if (run.code) {
+    node = <code>{node}</code>;
+  }
+  if (run.em) {
+    node = <em>{node}</em>;
+  }
+  if (run.bold) {
+    node = <strong>{node}</strong>;
+  }
+  if (run.href) {
+    node = <Link to={run.href}>{node}</Link>;
+  }
+  return <Fragment key={idx}>{node}</Fragment>;
+}
+
+function estimateHeight(row: Run[][], minHeight: number): number {
+  const longest = Math.max(0, ...row.map(cell => cell.reduce((length, run) => length + run.text.length, 0)));
+  return Math.max(minHeight, Math.ceil(longest / CHARS_PER_LINE) * LINE_HEIGHT + ROW_PADDING);
+}
+
+// Index of the row containing the vertical position y (offsets are prefix sums of the heights)
+function rowAt(offsets: number[], y: number): number {
+  let low = 0;
+  let high = offsets.length - 2;
+  while (low < high) {
+    const mid = (low + high + 1) >> 1;
+    if (offsets[mid] <= y) {
+      low = mid;
+    } else {
+      high = mid - 1;
+    }
+  }
+  return Math.max(0, low);
+}
+
+export default function VirtualTable({
+  load,
+  rows,
+  rowHeight = 36,
+  visibleRows = 15,
+}: VirtualTableProps): ReactNode {
+  const {data, error} = useSidecarData(load);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [measuredHeights, setMeasuredHeights] = useState<number[]>([]);
+  const [, setWidth] = useState(0);
+  const viewportRef = useRef<HTMLDivElement>(null);
+  const rowRefs = useRef(new Map<number, HTMLDivElement>());
+
+  // Estimates until the first measurement pass has replaced them
+  const estimatedHeights = useMemo(
+    () => (data ? data.rows.map(row => estimateHeight(row, rowHeight)) : []),
+    [data, rowHeight],
+  );
+  const heights = measuredHeights.length === estimatedHeights.length ? measuredHeights : estimatedHeights;
+
+  // Wrapped rows change height with the table width: re-render so they are measured again
+  useEffect(() => {
+    const viewport = viewportRef.current;
+    if (!viewport || typeof ResizeObserver === 'undefined') {
+      return undefined;
+    }
+    const observer = new ResizeObserver(entries => setWidth(entries[0].contentRect.width));
+    observer.observe(viewport);
+    return () => observer.disconnect();
+  }, [data]);
+
+  // Replace estimates with the measured heights of the rendered rows
+  useIsomorphicLayoutEffect(() => {
+    let measured: number[] | null = null;
+    for (const [index, element] of rowRefs.current) {
+      const height = element.offsetHeight;
+      if (height > 0 && Math.abs(height - heights[index]) > 0.5) {
+        measured ??= heights.slice();
+        measured[index] = height;
+      }
+    }
+    if (measured) {
+      setMeasuredHeights(measured);
+    }
+  });
+
+  const offsets = useMemo(() => {
+    const result = [0];
+    for (const height of heights) {
+      result.push(result[result.length - 1] + height);
+    }
+    return result;
+  }, [heights]);
+
+  const viewportHeight = Math.min(rows, visibleRows) * rowHeight;
+
+  if (error) {
+    return <div className={styles.status}>Could not load table: {error}</div>;
+  }
+
+  if (!data) {
+    return (
+      <div className={styles.status} style={{minHeight: viewportHeight}}>
+        Loading {rows} rows…
+      </div>
+    );
+  }
+
+  const template = `repeat(${data.columns.length}, minmax(8rem, 1fr))`;
+  const first = Math.max(0, rowAt(offsets, scrollTop) - OVERSCAN);
+  const last = Math.min(data.rows.length, rowAt(offsets, scrollTop + viewportHeight) + 1 + OVERSCAN);
+
+  return (
+    <div className={styles.table} role="table" aria-rowcount={data.rows.length + 1}>
+      <div className={clsx(styles.row, styles.header)} role="row" style={{gridTemplateColumns: template}}>
+        {data.columns.map((column, idx) => (
+          <div key={idx} className={styles.cell} role="columnheader">
+            {column}
+          </div>
+        ))}
+      </div>
+      <div
+        ref={viewportRef}
+        className={styles.viewport}
+        style={{height: viewportHeight}}
+        onScroll={(event: UIEvent<HTMLDivElement>) => setScrollTop(event.currentTarget.scrollTop)}>
+        <div style={{height: offsets[offsets.length - 1], position: 'relative'}}>
+          {data.rows.slice(first, last).map((row, offset) => {
+            const index = first + offset;
+            return (
+              <div
+                key={index}
+                ref={element => {
+                  if (element) {
+                    rowRefs.current.set(index, element);
+                  } else {
+                    rowRefs.current.delete(index);
+                  }
+                }}
+                className={styles.row}
+                role="row"
+                aria-rowindex={index + 2}
+                style={{
+                  gridTemplateColumns: template,
+                  minHeight: rowHeight,
+                  transform: `translateY(${offsets[index]}px)`,
+                }}>
+                {row.map((cell, idx) => (
+                  <div key={idx} className={styles.cell} role="cell">
+                    {cell.map(renderRun)}
+                  </div>
+                ))}
+              </div>
+            );
+          })}
+        </div>
+      </div>
+    </div>
+  );
+}
@@ -0,0 +1,36 @@
+import {useEffect, useRef, useState} from 'react';
+
+type SidecarModule<T> = T | {default: T};
+
+// Loads a JSON sidecar written by doxygen_to_markdown.py (_data/<key>.json) once `enabled` is set.
+// MDX passes a new `load` arrow on every render, so only the latest one is kept in a ref.
+export default function useSidecarData<T extends object>(
+  load: () => Promise<SidecarModule<T>>,
+  enabled = true,
+): {data: T | null; error: string | null} {
+  const loadRef = useRef(load);
+  loadRef.current = load;
+
+  const [data, setData] = useState<T | null>(null);
+  const [error, setError] = useState<string | null>(null);
+
+  useEffect(() => {
+    if (!enabled) {
+      return undefined;
+    }
+    let active = true;
+    loadRef
+      .current()
+      .then(module => {
+        if (active) {
+          setData(('default' in module ? module.default : module) as T);
+        }
+      })
+      .catch(err => active && setError(String(err)));
+    return () => {
+      active = false;
+    };
+  }, [enabled]);
+
+  return {data, error};
+}
@@ -0,0 +1,119 @@
+"""Offline-Tests für repo_fetch.py gegen lokale Bare-Repositories"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from repo_fetch import RepositoryFetcher, parse_doxyfile  # noqa: E402
+
+DOXYFILE = """\
+PROJECT_NAME     = "Sample"
+@INCLUDE_PATH    = doxy
+@INCLUDE         = common.cfg
+INPUT            = include \\
+                   src
+FILE_PATTERNS    = *.h
+RECURSIVE        = YES
+INPUT_FILTER     = "python3 tools/filter.py"
+FILTER_PATTERNS  = "*.md=tools/md_filter.sh"
+EXAMPLE_PATH     = examples
+EXAMPLE_PATTERNS = *.c
+OUTPUT_DIRECTORY = doxygen
+"""
+
+FILES = {
+    'Doxyfile': DOXYFILE,
+    'doxy/common.cfg': "IMAGE_PATH = img\n",
+    'include/wb.h': "int wb(void);\n",
+    'src/core/wb_core.h': "int core(void);\n",
+    'src/core/wb_core.c': "int core(void) { return 0; }\n",
+    'tools/filter.py': "import sys\n",
+    'tools/md_filter.sh': "cat \"$1\"\n",
+    'examples/demo.c': "int main(void) { return 0; }\n",
+    'examples/notes.txt': "not an example\n",
+    'img/logo.png': "png",
+    'firmware/blob.bin': "x" * 4096,
+}
+
+
+def git(*args: str, cwd: Path):
+    subprocess.run(['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+                   cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def bare_repo(tmp_path: Path) -> Path:
+    work = tmp_path / 'work'
+    for name, content in FILES.items():
+        (work / name).parent.mkdir(parents=True, exist_ok=True)
+        (work / name).write_text(content)
+
+    git('init', '--quiet', '--initial-branch=main', str(work), cwd=tmp_path)
+    git('add', '-A', cwd=work)
+    git('commit', '--quiet', '-m', 'initial', cwd=work)
+    git('tag', 'v1.0.0', cwd=work)
+
+    bare = tmp_path / 'origin.git'
+    git('clone', '--quiet', '--bare', str(work), str(bare), cwd=tmp_path)
+    git('config', 'uploadpack.allowFilter', 'true', cwd=bare)
+    return bare
+
+
+def test_parse_doxyfile_continuations_and_append():
+    values = parse_doxyfile("INPUT = a \\\n        b\nINPUT += c\nFILE_PATTERNS = *.h *.c\n")
+    assert values['INPUT'] == ['a', 'b', 'c']
+    assert values['FILE_PATTERNS'] == ['*.h', '*.c']
+
+
+def test_parse_doxyfile_evaluates_includes_in_place():
+    included = {'doxy/base.cfg': "INPUT = base\nIMAGE_PATH = img\n"}
+
+    def loader(name, include_paths):
+        for candidate in [name] + [f"{path}/{name}" for path in include_paths]:
+            if candidate in included:
+                return candidate, included[candidate]
+        return None
+
+    values = parse_doxyfile("@INCLUDE_PATH = doxy\n@INCLUDE = base.cfg\nINPUT += extra\n", loader)
+    assert values['INPUT'] == ['base', 'extra']
+    assert values['IMAGE_PATH'] == ['img']
+    assert values['@INCLUDE'] == ['doxy/base.cfg']
+
+
+def test_sparse_checkout_contains_only_doxygen_inputs(bare_repo: Path, tmp_path: Path):
+    repo_dir = tmp_path / 'clone'
+    fetcher = RepositoryFetcher(repo_dir)
+    fetcher.fetch(f"file://{bare_repo}")
+    fetcher.checkout('current')
+
+    for name in ('Doxyfile', 'doxy/common.cfg', 'include/wb.h', 'src/core/wb_core.h', 'tools/filter.py',
+                 'tools/md_filter.sh', 'examples/demo.c', 'img/logo.png'):
+        assert (repo_dir / name).exists(), name
+    for name in ('src/core/wb_core.c', 'examples/notes.txt', 'firmware/blob.bin'):
+        assert not (repo_dir / name).exists(), name
+
+    partial = subprocess.run(['git', '-C', str(repo_dir), 'config', 'remote.origin.partialclonefilter'],
+                             capture_output=True, text=True)
+    assert partial.stdout.strip() == 'blob:none'
+
+
+def test_checkout_release_tag_and_refetch(bare_repo: Path, tmp_path: Path):
+    fetcher = RepositoryFetcher(tmp_path / 'clone')
+    fetcher.fetch(f"file://{bare_repo}")
+    fetcher.fetch(f"file://{bare_repo}")
+
+    assert fetcher.resolve('1.0.0') == 'refs/tags/v1.0.0'
+    assert fetcher.checkout('1.0.0')
+    assert (tmp_path / 'clone' / 'include' / 'wb.h').exists()
+
+
+def test_unknown_path_setting_falls_back_to_full_tree(bare_repo: Path, tmp_path: Path):
+    fetcher = RepositoryFetcher(tmp_path / 'clone')
+    fetcher.fetch(f"file://{bare_repo}")
+
+    doxyfile = parse_doxyfile(DOXYFILE + "CUSTOM_SNIPPET_PATH = snippets\n")
+    assert fetcher.sparse_patterns('refs/remotes/origin/main', doxyfile) is None